@@ -5,8 +5,48 @@ PyInstaller spec file for QDevKit
 Qt-based Developer Tools Application
 """
 
+import sys
+
 block_cipher = None
 
+# Strip debug symbols from the bundled binaries on Linux to shrink the
+# distributable; stripping is not recommended for Windows and breaks
+# code signatures on macOS
+strip_binaries = sys.platform.startswith('linux')
+
+# Qt modules and libraries the tools never use. PySide6's hooks collect Qt
+# libraries and plugins per imported module, so excluding them keeps e.g.
+# the multimedia, QML and SQL driver plugins out of the bundle.
+excludes = [
+    'PySide6.Qt3DAnimation',
+    'PySide6.Qt3DCore',
+    'PySide6.Qt3DExtras',
+    'PySide6.Qt3DInput',
+    'PySide6.Qt3DLogic',
+    'PySide6.Qt3DRender',
+    'PySide6.QtBluetooth',
+    'PySide6.QtCharts',
+    'PySide6.QtDataVisualization',
+    'PySide6.QtMultimedia',
+    'PySide6.QtMultimediaWidgets',
+    'PySide6.QtNetwork',
+    'PySide6.QtOpenGL',
+    'PySide6.QtOpenGLWidgets',
+    'PySide6.QtPdf',
+    'PySide6.QtPositioning',
+    'PySide6.QtQml',
+    'PySide6.QtQuick',
+    'PySide6.QtQuickWidgets',
+    'PySide6.QtSql',
+    'PySide6.QtSvg',
+    'PySide6.QtWebEngineCore',
+    'PySide6.QtWebEngineWidgets',
+    'PySide6.QtWebSockets',
+    'numpy',
+    'pandas',
+    'tkinter',
+]
+
 a = Analysis(
     ['main.py'],
     pathex=[],
@@ -16,11 +56,22 @@ a = Analysis(
         'PySide6.QtCore',
         'PySide6.QtGui',
         'PySide6.QtWidgets',
+        # Imported by ui.main_window only when each tool is first selected
+        'tools.json_formatter',
+        'tools.json_path_filter',
+        'tools.base64_tool',
+        'tools.uuid_generator',
+        'tools.jwt_decoder',
+        'tools.url_encoder',
+        'tools.timestamp_converter',
+        'tools.hash_generator',
+        'orjson',
+        'ijson',
     ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -37,7 +88,7 @@ exe = EXE(
     name='QDevKit',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
+    strip=strip_binaries,
     upx=True,
     console=False,
     disable_windowed_traceback=False,
@@ -52,7 +103,7 @@ coll = COLLECT(
     a.binaries,
     a.zipfiles,
     a.datas,
-    strip=False,
+    strip=strip_binaries,
     upx=True,
     upx_exclude=[],
     name='QDevKit',
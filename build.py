@@ -9,17 +9,49 @@ import sys
 import subprocess
 import platform
 import shutil
+import ssl
+import time
 from pathlib import Path
 
 
-def run_command(cmd, cwd=None):
-    """Run a command and print output"""
+APPIMAGE_SCRIPT = Path("build/linux/appimage/build-appimage.sh")
+
+
+def start_command(cmd, cwd=None):
+    """Start a command without waiting for it to finish"""
     print(f"Running: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=cwd)
-    if result.returncode != 0:
-        print(f"Command failed with return code {result.returncode}")
+    return subprocess.Popen(cmd, cwd=cwd)
+
+
+def wait_command(process):
+    """Wait for a started command and exit if it failed"""
+    returncode = process.wait()
+    if returncode != 0:
+        print(f"Command failed with return code {returncode}")
         sys.exit(1)
-    return result
+    return process
+
+
+def run_command(cmd, cwd=None):
+    """Run a command and stream its output with elapsed-time prefixes"""
+    print(f"Running: {' '.join(cmd)}")
+    started = time.monotonic()
+    process = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        errors="replace",
+    )
+
+    # Reading line by line keeps the pipe drained and makes a stalled step
+    # visible in CI logs as a gap in the timestamps
+    for line in process.stdout:
+        print(f"[{time.monotonic() - started:7.1f}s] {line}", end="", flush=True)
+
+    return wait_command(process)
 
 
 def build_pyinstaller():
@@ -34,13 +66,47 @@ def build_pyinstaller():
         print(f"Error: {spec_file} not found!")
         sys.exit(1)
 
+    # hashlib links against this OpenSSL; hardware SHA support depends on it
+    print(f"Bundled OpenSSL: {ssl.OPENSSL_VERSION}")
+
+    # Compress binaries with UPX when it is installed. The spec enables UPX
+    # already; pointing PyInstaller at it explicitly avoids silently
+    # shipping an uncompressed build when the lookup fails.
+    pyinstaller_cmd = ["pyinstaller", "--clean"]
+    upx = shutil.which("upx")
+    if upx:
+        pyinstaller_cmd += ["--upx-dir", str(Path(upx).parent)]
+    else:
+        print("UPX not found; binaries will not be compressed")
+
     # Run PyInstaller
-    run_command(["pyinstaller", "--clean", str(spec_file)])
+    run_command(pyinstaller_cmd + [str(spec_file)])
 
     print("\n✅ PyInstaller build completed!")
     print(f"Output directory: dist/QDevKit/")
 
 
+def prepare_appimage_script():
+    """Check the AppImage build script exists and make it executable"""
+    if not APPIMAGE_SCRIPT.exists():
+        print(f"Error: {APPIMAGE_SCRIPT} not found!")
+        print("Please create the AppImage build script first.")
+        sys.exit(1)
+
+    # Make script executable
+    os.chmod(APPIMAGE_SCRIPT, 0o755)
+
+
+def start_appimage_tools_fetch():
+    """Download the AppImage tooling in the background
+
+    The AppImage itself is built from the PyInstaller output, so only the
+    tool download can overlap with the PyInstaller build.
+    """
+    prepare_appimage_script()
+    return start_command([str(APPIMAGE_SCRIPT), "--fetch-tools"], cwd=Path.cwd())
+
+
 def build_appimage():
     """Build AppImage for Linux"""
     if platform.system() != "Linux":
@@ -51,17 +117,10 @@ def build_appimage():
     print("Building AppImage...")
     print("=" * 60)
 
-    appimage_script = Path("build/linux/appimage/build-appimage.sh")
-    if not appimage_script.exists():
-        print(f"Error: {appimage_script} not found!")
-        print("Please create the AppImage build script first.")
-        sys.exit(1)
-
-    # Make script executable
-    os.chmod(appimage_script, 0o755)
+    prepare_appimage_script()
 
     # Run AppImage build
-    run_command([str(appimage_script)], cwd=Path.cwd())
+    run_command([str(APPIMAGE_SCRIPT)], cwd=Path.cwd())
 
     print("\n✅ AppImage build completed!")
 
@@ -81,6 +140,11 @@ def main():
         action="store_true",
         help="Clean build directories before building"
     )
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Download AppImage tooling while PyInstaller runs (with --appimage)"
+    )
 
     args = parser.parse_args()
 
@@ -92,11 +156,18 @@ def main():
                 shutil.rmtree(dir_name)
                 print(f"Removed {dir_name}/")
 
+    # Fetch AppImage tooling alongside PyInstaller if requested
+    tools_fetch = None
+    if args.parallel and args.appimage and platform.system() == "Linux":
+        tools_fetch = start_appimage_tools_fetch()
+
     # Build with PyInstaller
     build_pyinstaller()
 
     # Build AppImage if requested
     if args.appimage:
+        if tools_fetch is not None:
+            wait_command(tools_fetch)
         build_appimage()
 
     print("\n" + "=" * 60)
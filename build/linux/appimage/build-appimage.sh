@@ -12,6 +12,25 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+# Download linuxdeploy if not exists
+LINUXDEPLOY="$HOME/.local/bin/linuxdeploy-x86_64.AppImage"
+fetch_linuxdeploy() {
+    if [ ! -f "$LINUXDEPLOY" ]; then
+        echo -e "${YELLOW}Downloading linuxdeploy...${NC}"
+        mkdir -p "$HOME/.local/bin"
+        wget -c "https://github.com/linuxdeploy/linuxdeploy/releases/download/continuous/linuxdeploy-x86_64.AppImage" \
+            -O "$LINUXDEPLOY"
+        chmod +x "$LINUXDEPLOY"
+    fi
+}
+
+# --fetch-tools only downloads the build tools, so it can run while
+# PyInstaller is still building
+if [ "$1" = "--fetch-tools" ]; then
+    fetch_linuxdeploy
+    exit 0
+fi
+
 echo -e "${GREEN}================================================${NC}"
 echo -e "${GREEN}  Building QDevKit AppImage${NC}"
 echo -e "${GREEN}================================================${NC}"
@@ -83,15 +102,7 @@ cp "$PROJECT_ROOT/build/linux/appimage/$APP_NAME.svg" "$APPDIR/usr/share/icons/h
 sed -i "s|^Exec=.*|Exec=AppRun|" "$APPDIR/$APP_NAME.desktop"
 
 # Download linuxdeploy if not exists
-LINUXDEPLOY="$HOME/.local/bin/linuxdeploy-x86_64.AppImage"
-if [ ! -f "$LINUXDEPLOY" ]; then
-    echo -e "${YELLOW}Downloading linuxdeploy...${NC}"
-    mkdir -p "$HOME/.local/bin"
-    wget -c "https://github.com/linuxdeploy/linuxdeploy/releases/download/continuous/linuxdeploy-x86_64.AppImage" \
-        -O "$LINUXDEPLOY"
-    chmod +x "$LINUXDEPLOY"
-fi
-
+fetch_linuxdeploy
 # Build AppImage
 echo -e "${YELLOW}Building AppImage...${NC}"
 export OUTPUT="$APP_VERSION-$APP_NAME-x86_64.AppImage"
@@ -5,9 +5,23 @@ Main entry point
 """
 
 import sys
-from PySide6.QtWidgets import QApplication
+from PySide6.QtWidgets import QApplication, QSplashScreen
 from PySide6.QtCore import Qt
-from ui.main_window import MainWindow
+from PySide6.QtGui import QColor, QPixmap
+
+
+def create_splash():
+    """Create a plain splash screen shown while the main window loads"""
+    pixmap = QPixmap(360, 120)
+    pixmap.fill(QColor("#2b2b2b"))
+
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        "QDevKit\nLoading developer tools...",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor("#ffffff"),
+    )
+    return splash
 
 
 def main():
@@ -21,8 +35,17 @@ def main():
     # Enable high DPI scaling
     app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
 
+    # Show the splash before importing the main window; tool modules are
+    # imported later, when each tool is first selected
+    splash = create_splash()
+    splash.show()
+    app.processEvents()
+
+    from ui.main_window import MainWindow
+
     window = MainWindow()
     window.show()
+    splash.finish(window)
 
     sys.exit(app.exec())
 
@@ -0,0 +1,53 @@
+"""
+JSON parsing and serialization shared by the tools
+"""
+
+import json
+import re
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json module is the fallback
+    orjson = None
+
+# orjson parses integers outside the 64-bit range as floats, losing
+# precision, so inputs containing 19+ digit runs are left to the stdlib
+# parser; 19 digits already go below -2**63
+_LONG_DIGITS = re.compile(rb'\d{19}')
+
+
+def loads(raw):
+    """Parse UTF-8 encoded JSON, preferring orjson when it is installed
+
+    Returns (data, native) where native is True if orjson parsed the text and
+    can therefore serialize the result without losing anything.
+    """
+    if orjson is not None and not _LONG_DIGITS.search(raw):
+        try:
+            return orjson.loads(raw), True
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the stdlib accepts; it also
+            # gives the authoritative error message for invalid input
+            pass
+    return json.loads(raw), False
+
+
+def dumps(data, indent=None, sort_keys=False, native=False):
+    """Serialize data to JSON text, compact when indent is None"""
+    # orjson only supports compact and 2-space indented output, and would
+    # write NaN/Infinity from stdlib-parsed data as null
+    if native and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent == 2 else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # orjson refuses to serialize more than 254 levels of nesting,
+            # although it parses deeper documents; the stdlib serializer only
+            # stops at the interpreter's recursion limit
+            pass
+
+    if indent is None:
+        return json.dumps(data, separators=(',', ':'), sort_keys=sort_keys, ensure_ascii=False)
+    return json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
@@ -0,0 +1,95 @@
+"""
+Stylesheets shared by the tools
+"""
+
+# Shared by all buttons; the copy, now, swap and clear buttons are picked out
+# by object name
+BUTTON_STYLE = """
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-size: 13px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton:pressed {
+        background-color: #005a9e;
+    }
+    QPushButton#copyButton, QPushButton#nowButton {
+        background-color: #107c10;
+    }
+    QPushButton#copyButton:hover, QPushButton#nowButton:hover {
+        background-color: #0c5c0c;
+    }
+    QPushButton#swapButton {
+        background-color: #5c2d91;
+    }
+    QPushButton#swapButton:hover {
+        background-color: #44226b;
+    }
+    QPushButton#clearButton {
+        background-color: #d13438;
+    }
+    QPushButton#clearButton:hover {
+        background-color: #a92a2d;
+    }
+"""
+
+# Example buttons, picked out by the group box holding them; combined with
+# BUTTON_STYLE, whose properties they override
+EXAMPLE_BUTTON_STYLE = """
+    QGroupBox QPushButton {
+        background-color: #f5f5f5;
+        color: black;
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 6px 10px;
+        font-size: 11px;
+        font-weight: normal;
+        font-family: Consolas;
+        text-align: left;
+    }
+    QGroupBox QPushButton:hover {
+        background-color: #e5e5e5;
+        border-color: #0078d4;
+    }
+"""
+
+# Status label colours, chosen by the label's "state" property so the sheet
+# is parsed once instead of on every status update
+STATUS_STYLE = """
+    QLabel {
+        color: #666;
+        padding: 5px;
+    }
+    QLabel[state="info"] {
+        color: #17a2b8;
+    }
+    QLabel[state="warn"] {
+        color: #f0ad4e;
+    }
+    QLabel[state="error"] {
+        color: #dc3545;
+    }
+    QLabel[state="success"] {
+        color: #28a745;
+    }
+"""
+
+
+def set_status(label, text, state):
+    """Show text on a status label styled with STATUS_STYLE
+
+    state is one of "info", "warn", "error", "success" or "busy"; the style
+    is re-polished because Qt does not watch dynamic properties.
+    """
+    label.setText(text)
+    label.setProperty("state", state)
+    style = label.style()
+    style.unpolish(label)
+    style.polish(label)
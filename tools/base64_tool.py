@@ -10,6 +10,8 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+from tools._styles import BUTTON_STYLE
+
 
 class Base64Tool(QWidget):
     """Tool for Base64 encoding and decoding"""
@@ -106,38 +108,9 @@ class Base64Tool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#swapButton {
-                background-color: #5c2d91;
-            }
-            QPushButton#swapButton:hover {
-                background-color: #44226b;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.convert_btn.setStyleSheet(button_style)
-        self.swap_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#swapButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        self.swap_btn.setObjectName("swapButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
 
     def convert(self):
         """Perform encode or decode based on selected mode"""
@@ -3,12 +3,184 @@ Hash Generator Tool
 """
 
 import hashlib
+import mmap
+import os
+import ssl
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
-    QLabel, QRadioButton, QButtonGroup, QFrame
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
+    QLabel, QRadioButton, QButtonGroup, QCheckBox, QFrame
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QFont, QGuiApplication
+
+from tools._styles import BUTTON_STYLE
+
+# (display name, hashlib name) keyed by the algorithm button group ids
+HASH_ALGORITHMS = {
+    1: ('MD5', 'md5'),
+    2: ('SHA1', 'sha1'),
+    3: ('SHA256', 'sha256'),
+    4: ('SHA512', 'sha512'),
+    5: ('SHA512/256', 'sha512_256'),
+}
+DEFAULT_ALGORITHM = 2
+
+# Optional tree hash: SHA-256 over the SHA-256 digests of fixed-size blocks,
+# which lets the blocks be hashed on all cores. It does not match any
+# standard SHA-256 digest.
+TREE_ALGORITHM = ('SHA256-Tree (non-standard)', 'sha256_tree')
+TREE_BLOCK_SIZE = 1 << 20
+
+# Feed the hashes in 64 KiB slices so each slice stays in the CPU cache
+# while every algorithm reads it
+CHUNK_SIZE = 1 << 16
+
+# Above this size each algorithm digests the whole buffer in one native
+# update() on its own thread instead of sharing the chunked loop
+PARALLEL_THRESHOLD = 1 << 20
+
+# Number of recent inputs whose digests are kept by each tool instance
+CACHE_SIZE = 32
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+
+def sha256_tree(data):
+    """Return the hex SHA256-Tree digest of data
+
+    Each TREE_BLOCK_SIZE block is hashed on its own thread, then the block
+    digests are concatenated and hashed again.
+    """
+    view = memoryview(data)
+    blocks = [
+        view[offset:offset + TREE_BLOCK_SIZE]
+        for offset in range(0, len(view), TREE_BLOCK_SIZE)
+    ]
+    with ThreadPoolExecutor() as executor:
+        block_digests = executor.map(
+            lambda block: hashlib.new('sha256', block, usedforsecurity=False).digest(), blocks
+        )
+        return hashlib.new('sha256', b''.join(block_digests), usedforsecurity=False).hexdigest()
+
+
+def compute_hashes(data):
+    """Return {algorithm: hex digest} of data for every supported algorithm
+
+    All digests are computed in a single pass over the input, so toggling
+    algorithms afterwards needs no further work. The SHA256-Tree digest is
+    not included; sha256_tree computes it on its own.
+    """
+    # usedforsecurity=False selects OpenSSL's EVP implementation directly
+    # and keeps MD5/SHA1 available on FIPS-restricted builds
+    hash_objs = {
+        algorithm: hashlib.new(algorithm, usedforsecurity=False)
+        for _, algorithm in HASH_ALGORITHMS.values()
+        if algorithm in hashlib.algorithms_available
+    }
+
+    # Hash through a memoryview to avoid slice copies
+    view = memoryview(data)
+
+    if len(view) > PARALLEL_THRESHOLD:
+        # hashlib drops the GIL for the whole update() call, so the
+        # algorithms run concurrently with no per-chunk Python dispatch
+        with ThreadPoolExecutor(max_workers=len(hash_objs)) as executor:
+            list(executor.map(lambda hash_obj: hash_obj.update(view), hash_objs.values()))
+    else:
+        for offset in range(0, len(view), CHUNK_SIZE):
+            chunk = view[offset:offset + CHUNK_SIZE]
+            for hash_obj in hash_objs.values():
+                hash_obj.update(chunk)
+
+    return {algorithm: hash_obj.hexdigest() for algorithm, hash_obj in hash_objs.items()}
+
+
+@lru_cache(maxsize=None)
+def sha512_outpaces_sha256():
+    """Whether SHA-512 hashes bulk data faster than SHA-256 on this host
+
+    SHA-512 works on 64-bit words and usually wins on 64-bit CPUs without
+    SHA-NI; on 32-bit hosts SHA-256 is always faster.
+    """
+    if sys.maxsize <= 2 ** 32:
+        return False
+
+    sample = bytes(1 << 20)
+    timings = {}
+    for algorithm in ('sha256', 'sha512'):
+        start = time.perf_counter()
+        hashlib.new(algorithm, sample, usedforsecurity=False).digest()
+        timings[algorithm] = time.perf_counter() - start
+    return timings['sha512'] < timings['sha256']
+
+
+class HashWorkerSignals(QObject):
+    """Signals emitted by HashWorker back to the GUI thread"""
+
+    finished = Signal(object, object)  # input fingerprint, {algorithm: digest}
+    failed = Signal(str)
+
+
+class HashWorker(QRunnable):
+    """Computes hashes on the thread pool so large inputs don't block the UI"""
+
+    def __init__(self, data, cache, tree=False):
+        super().__init__()
+        self.data = data
+        # Read-only here; the tool updates it on the GUI thread once we finish
+        self.cache = cache
+        self.tree = tree
+        self.signals = HashWorkerSignals()
+
+    def run(self):
+        """Hash the data; hashlib releases the GIL while digesting"""
+        try:
+            # A 128-bit BLAKE2b fingerprint identifies the input without
+            # keeping a copy of it in the cache
+            fingerprint = hashlib.blake2b(self.data, digest_size=16).digest()
+            # Only the missing digests are computed and merged into a new
+            # dict, leaving the cached one to the GUI thread
+            digests = self.cache.get(fingerprint, {})
+            if self.tree:
+                if TREE_ALGORITHM[1] not in digests:
+                    digests = {**digests, TREE_ALGORITHM[1]: sha256_tree(self.data)}
+            elif digests.keys() <= {TREE_ALGORITHM[1]}:
+                digests = {**digests, **compute_hashes(self.data)}
+            self.signals.finished.emit(fingerprint, digests)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+
+class FileHashWorker(HashWorker):
+    """Hashes a file through a read-only memory map instead of reading it in"""
+
+    def __init__(self, path, tree=False):
+        super().__init__(None, None, tree)
+        self.path = path
+
+    def run(self):
+        """Hash the file; pages are read by the kernel as the hashes need them"""
+        try:
+            hash_data = sha256_tree if self.tree else compute_hashes
+            with open(self.path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    digests = hash_data(b'')  # Empty files cannot be mapped
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        digests = hash_data(mapped)
+            if self.tree:
+                digests = {TREE_ALGORITHM[1]: digests}
+            # File contents may change between runs, so they are not cached
+            self.signals.finished.emit(None, digests)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 
 class HashGeneratorTool(QWidget):
@@ -16,6 +188,9 @@ class HashGeneratorTool(QWidget):
 
     def __init__(self):
         super().__init__()
+        self._pending = None  # Size of the input being hashed, as shown in the status
+        self._result = None  # (size, digests) for the current input
+        self._cache = OrderedDict()
         self.setup_ui()
 
     def setup_ui(self):
@@ -26,30 +201,33 @@ class HashGeneratorTool(QWidget):
 
         # Title
         title = QLabel("Hash Generator")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
-            "Generate cryptographic hashes from text using MD5, SHA1, SHA256, or SHA512 algorithms."
+            "Generate cryptographic hashes from text or files using MD5, SHA1, SHA256, SHA512, "
+            "or SHA512/256 algorithms."
         )
         description.setStyleSheet("color: #666;")
         layout.addWidget(description)
 
         # Input section
         input_label = QLabel("Input Text:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
-        self.input_text = QTextEdit()
+        self.input_text = QPlainTextEdit()
         self.input_text.setPlaceholderText("Enter text to hash...")
         self.input_text.setMinimumHeight(120)
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
+        self.input_text.textChanged.connect(self.on_input_changed)
         layout.addWidget(self.input_text)
 
         # Algorithm selection
         algo_layout = QHBoxLayout()
         algo_label = QLabel("Algorithm:")
-        algo_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        algo_label.setFont(_LABEL_FONT)
+        algo_label.setToolTip(f"Hash backend: {ssl.OPENSSL_VERSION}")
         algo_layout.addWidget(algo_label)
 
         self.algo_group = QButtonGroup()
@@ -63,14 +241,49 @@ class HashGeneratorTool(QWidget):
         self.algo_group.addButton(self.sha1_radio, 2)
         self.algo_group.addButton(self.sha256_radio, 3)
         self.algo_group.addButton(self.sha512_radio, 4)
+        self.algo_group.idClicked.connect(self.on_algorithm_changed)
 
         algo_layout.addWidget(self.md5_radio)
         algo_layout.addWidget(self.sha1_radio)
         algo_layout.addWidget(self.sha256_radio)
         algo_layout.addWidget(self.sha512_radio)
+
+        # SHA-512/256 needs OpenSSL support, so only offer it when available
+        if HASH_ALGORITHMS[5][1] in hashlib.algorithms_available:
+            self.sha512_256_radio = QRadioButton("SHA512/256")
+            tooltip = (
+                "SHA-512 truncated to 256 bits (FIPS 180-4). "
+                "Produces a different digest than SHA256."
+            )
+            if sha512_outpaces_sha256():
+                tooltip += " Faster than SHA256 for large inputs on this machine."
+            self.sha512_256_radio.setToolTip(tooltip)
+            self.algo_group.addButton(self.sha512_256_radio, 5)
+            algo_layout.addWidget(self.sha512_256_radio)
+
         algo_layout.addStretch()
         layout.addLayout(algo_layout)
 
+        # Options
+        options_layout = QHBoxLayout()
+
+        self.file_cb = QCheckBox("Input is a file path")
+        self.file_cb.setToolTip("Hash the contents of the file at the path entered above")
+        self.file_cb.toggled.connect(self.on_input_changed)
+        options_layout.addWidget(self.file_cb)
+
+        self.tree_cb = QCheckBox(TREE_ALGORITHM[0])
+        self.tree_cb.setToolTip(
+            "Hash 1 MiB blocks in parallel and hash their SHA256 digests. "
+            "Faster than SHA256 for large inputs on multi-core machines, "
+            "but does not match a standard SHA256 digest."
+        )
+        self.tree_cb.toggled.connect(self.on_tree_toggled)
+        options_layout.addWidget(self.tree_cb)
+
+        options_layout.addStretch()
+        layout.addLayout(options_layout)
+
         # Buttons
         button_layout = QHBoxLayout()
 
@@ -93,13 +306,14 @@ class HashGeneratorTool(QWidget):
 
         # Output section
         output_label = QLabel("Hash:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)  # Generated text needs no undo history
         self.output_text.setMinimumHeight(120)
-        self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setFont(_MONO_FONT)
         layout.addWidget(self.output_text)
 
         # Status bar
@@ -114,54 +328,47 @@ class HashGeneratorTool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#copyButton {
-                background-color: #107c10;
-            }
-            QPushButton#copyButton:hover {
-                background-color: #0c5c0c;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.generate_btn.setStyleSheet(button_style)
-        self.copy_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#copyButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        self.copy_btn.setObjectName("copyButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
 
     def get_selected_algorithm(self):
-        """Get the selected hash algorithm"""
-        checked = self.algo_group.checkedId()
-        if checked == 1:
-            return "MD5"
-        elif checked == 2:
-            return "SHA1"
-        elif checked == 3:
-            return "SHA256"
-        elif checked == 4:
-            return "SHA512"
-        return "SHA1"  # Default
+        """Get the (display name, hashlib name) of the selected hash algorithm"""
+        if self.tree_cb.isChecked():
+            return TREE_ALGORITHM
+        return HASH_ALGORITHMS.get(
+            self.algo_group.checkedId(), HASH_ALGORITHMS[DEFAULT_ALGORITHM]
+        )
+
+    def on_input_changed(self):
+        """Forget digests of the previous input once it is edited"""
+        self._pending = None
+        self._result = None
+
+    def on_algorithm_changed(self, algo_id):
+        """Show the newly selected digest if the input was already hashed"""
+        if self._result is not None:
+            self.show_hash()
+
+    def on_tree_toggled(self, checked):
+        """Switch between the tree digest and the selected algorithm"""
+        for button in self.algo_group.buttons():
+            button.setEnabled(not checked)
+
+        if self._result is not None:
+            self.show_hash()
 
     def generate_hash(self):
         """Generate hash from input text"""
+        # A file may have changed since it was hashed, so always re-read it
+        if (
+            self._result is not None
+            and not self.file_cb.isChecked()
+            and self.get_selected_algorithm()[1] in self._result[1]
+        ):
+            self.show_hash()
+            return
+
         input_data = self.input_text.toPlainText()
 
         if not input_data:
@@ -169,43 +376,85 @@ class HashGeneratorTool(QWidget):
             self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
             return
 
-        try:
-            algorithm = self.get_selected_algorithm()
-
-            if algorithm == "MD5":
-                hash_obj = hashlib.md5()
-            elif algorithm == "SHA1":
-                hash_obj = hashlib.sha1()
-            elif algorithm == "SHA256":
-                hash_obj = hashlib.sha256()
-            elif algorithm == "SHA512":
-                hash_obj = hashlib.sha512()
-            else:
-                hash_obj = hashlib.sha256()
-
-            hash_obj.update(input_data.encode('utf-8'))
-            hash_hex = hash_obj.hexdigest()
-
-            self.output_text.setPlainText(hash_hex)
-
-            # Show hash info
-            char_count = len(input_data)
-            self.status_label.setText(
-                f"✅ {algorithm} hash generated ({char_count} chars → {len(hash_hex)} chars)"
-            )
-            self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
+        if self.file_cb.isChecked():
+            path = input_data.strip()
+            if not os.path.isfile(path):
+                self.status_label.setText(f"⚠️  File not found: {path}")
+                self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+                return
+            worker = FileHashWorker(path, self.tree_cb.isChecked())
+            self._pending = f"{os.path.getsize(path)} bytes"
+        else:
+            # CPython stores ASCII-only text one byte per char and encodes it
+            # to UTF-8 with a plain copy, so no separate ASCII path is needed
+            worker = HashWorker(input_data.encode('utf-8'), self._cache, self.tree_cb.isChecked())
+            self._pending = f"{len(input_data)} chars"
+        worker.signals.finished.connect(self.on_hash_finished)
+        worker.signals.failed.connect(self.on_hash_failed)
+
+        # The worker only computes the digests of the current mode
+        self.generate_btn.setEnabled(False)
+        self.tree_cb.setEnabled(False)
+        self.status_label.setText(f"⏳ Generating {self.get_selected_algorithm()[0]} hash...")
+        self.status_label.setStyleSheet("color: #666; padding: 5px;")
+        QThreadPool.globalInstance().start(worker)
+
+    def on_hash_finished(self, fingerprint, digests):
+        """Store the digests computed by the worker and show the selected one"""
+        self.generate_btn.setEnabled(True)
+        self.tree_cb.setEnabled(True)
+
+        # Remember the digests, evicting the least recently used input
+        if fingerprint is not None:
+            self._cache[fingerprint] = digests
+            self._cache.move_to_end(fingerprint)
+            while len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        if self._pending is None:
+            # Input edited or cleared while hashing; drop the progress message
+            self.status_label.setText("")
+            return
 
-        except Exception as e:
-            self.output_text.setPlainText("")
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
+        self._result = (self._pending, digests)
+        self._pending = None
+        self.show_hash()
+
+    def on_hash_failed(self, message):
+        """Report a hashing error from the worker"""
+        self.generate_btn.setEnabled(True)
+        self.tree_cb.setEnabled(True)
+        self._pending = None
+        self.output_text.setPlainText("")
+        self.status_label.setText(f"❌ Error: {message}")
+        self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
+
+    def show_hash(self):
+        """Display the selected algorithm's digest of the current input, or
+        ask for Generate Hash if it has not been computed
+        """
+        size, digests = self._result
+        algorithm, name = self.get_selected_algorithm()
+        hash_hex = digests.get(name)
+        if hash_hex is None:
+            # Not computed for this input yet; don't leave another digest up
+            self.output_text.clear()
+            self.status_label.setText(f"Press Generate Hash for the {algorithm} hash")
+            self.status_label.setStyleSheet("color: #666; padding: 5px;")
+            return
+        self.output_text.setPlainText(hash_hex)
+
+        # Show hash info
+        self.status_label.setText(
+            f"✅ {algorithm} hash generated ({size} → {len(hash_hex)} chars)"
+        )
+        self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
 
     def copy_hash(self):
         """Copy hash to clipboard"""
         hash_text = self.output_text.toPlainText()
         if hash_text:
-            self.output_text.selectAll()
-            self.output_text.copy()
+            QGuiApplication.clipboard().setText(hash_text)
             self.status_label.setText("✅ Hash copied to clipboard")
             self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
 
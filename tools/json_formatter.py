@@ -3,19 +3,60 @@ JSON Formatter Tool
 """
 
 import json
+import re
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QLabel, QCheckBox, QFrame
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+from tools._json import dumps, loads
+from tools._styles import BUTTON_STYLE
+
+# Inputs larger than this are minified by stripping whitespace outside
+# strings instead of parsing and re-serializing them, provided they hold at
+# most one quote per FAST_MINIFY_QUOTE_RATIO characters; string-heavy
+# documents are quicker to run through the parser
+FAST_MINIFY_THRESHOLD = 1 << 20
+FAST_MINIFY_QUOTE_RATIO = 32
+
+# A complete JSON string literal; raw line breaks are not allowed inside one
+_JSON_STRING = re.compile(r'("[^"\\\r\n]*(?:\\.[^"\\\r\n]*)*")')
+_WHITESPACE = str.maketrans('', '', ' \t\r\n')
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+
+def _minify_fast(text):
+    """Strip whitespace outside JSON strings without parsing the document
+
+    Returns None if the input is not worth scanning or its quotes are
+    unbalanced; the text then has to go through the full parser. The result
+    is not validated otherwise.
+    """
+    if len(text) <= FAST_MINIFY_THRESHOLD:
+        return None
+    if text.count('"') * FAST_MINIFY_QUOTE_RATIO > len(text):
+        return None
+
+    # Splitting on string literals alternates outside and string parts
+    parts = _JSON_STRING.split(text)
+    outside = parts[0::2]
+    if any('"' in part for part in outside):
+        return None
+    parts[0::2] = [part.translate(_WHITESPACE) for part in outside]
+    return ''.join(parts)
+
 
 class JsonFormatterTool(QWidget):
     """Tool for formatting and validating JSON"""
 
     def __init__(self):
         super().__init__()
+        self._parse_cache = None  # (data, native) for the current input
         self.setup_ui()
 
     def setup_ui(self):
@@ -26,7 +67,7 @@ class JsonFormatterTool(QWidget):
 
         # Title
         title = QLabel("JSON Formatter & Validator")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -37,13 +78,14 @@ class JsonFormatterTool(QWidget):
 
         # Input section
         input_label = QLabel("Input JSON:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
-        self.input_text = QTextEdit()
+        self.input_text = QPlainTextEdit()
         self.input_text.setPlaceholderText("Paste your JSON here...")
         self.input_text.setMinimumHeight(200)
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
+        self.input_text.textChanged.connect(self.on_input_changed)
         layout.addWidget(self.input_text)
 
         # Buttons
@@ -81,13 +123,14 @@ class JsonFormatterTool(QWidget):
 
         # Output section
         output_label = QLabel("Output:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
+        self.output_text.setUndoRedoEnabled(False)  # Generated text needs no undo history
         self.output_text.setMinimumHeight(200)
-        self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setFont(_MONO_FONT)
         layout.addWidget(self.output_text)
 
         # Status bar
@@ -102,50 +145,44 @@ class JsonFormatterTool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
+
+    def on_input_changed(self):
+        """Drop the cached parse once the input is edited"""
+        self._parse_cache = None
+
+    def parse_input(self):
+        """Parse the input JSON, reusing the previous result until it is edited
+
+        Returns (data, native) as produced by loads, or None if the input is
+        empty.
         """
-        self.format_btn.setStyleSheet(button_style)
-        self.minify_btn.setStyleSheet(button_style)
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        if self._parse_cache is None:
+            # Work on UTF-8 bytes: orjson parses them without another str copy.
+            # surrogatepass matches how json.loads decodes bytes.
+            raw = self.input_text.toPlainText().encode('utf-8', 'surrogatepass').strip()
+            if not raw:
+                return None
+            self._parse_cache = loads(raw)
+        return self._parse_cache
 
     def format_json(self):
         """Format the JSON input"""
-        input_data = self.input_text.toPlainText().strip()
-
-        if not input_data:
-            self.status_label.setText("⚠️  Please enter JSON data")
-            self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
-            return
-
         try:
-            data = json.loads(input_data)
+            parsed = self.parse_input()
+            if parsed is None:
+                self.status_label.setText("⚠️  Please enter JSON data")
+                self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+                return
+
+            data, native = parsed
             indent = 2 if self.indent_2_cb.isChecked() else 4
-            formatted = json.dumps(
+            formatted = dumps(
                 data,
                 indent=indent,
                 sort_keys=self.sort_keys_cb.isChecked(),
-                ensure_ascii=False
+                native=native
             )
             self.output_text.setPlainText(formatted)
             self.status_label.setText("✅ JSON formatted successfully")
@@ -157,16 +194,23 @@ class JsonFormatterTool(QWidget):
 
     def minify_json(self):
         """Minify the JSON input"""
-        input_data = self.input_text.toPlainText().strip()
-
-        if not input_data:
-            self.status_label.setText("⚠️  Please enter JSON data")
-            self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
-            return
+        if self._parse_cache is None:
+            minified = _minify_fast(self.input_text.toPlainText())
+            if minified is not None:
+                self.output_text.setPlainText(minified)
+                self.status_label.setText("✅ JSON minified (large input, not validated)")
+                self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
+                return
 
         try:
-            data = json.loads(input_data)
-            minified = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+            parsed = self.parse_input()
+            if parsed is None:
+                self.status_label.setText("⚠️  Please enter JSON data")
+                self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+                return
+
+            data, native = parsed
+            minified = dumps(data, native=native)
             self.output_text.setPlainText(minified)
             self.status_label.setText("✅ JSON minified successfully")
             self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
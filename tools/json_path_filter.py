@@ -2,17 +2,334 @@
 JSON Path Filter Tool
 """
 
+import io
 import json
-from functools import partial
+import os
+import re
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QLabel, QGroupBox, QComboBox, QGridLayout, QFrame, QLineEdit, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QCursor
-from jsonpath_ng import parse
-from jsonpath_ng.exceptions import JsonPathParserError
+from PySide6.QtCore import Qt, QCoreApplication, QObject, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QFont, QCursor, QGuiApplication
+from jsonpath_ng.exceptions import JsonPathLexerError, JsonPathParserError
+
+from tools._json import dumps, loads
+from tools._styles import BUTTON_STYLE, EXAMPLE_BUTTON_STYLE, STATUS_STYLE, set_status
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large inputs are then parsed whole
+    ijson = None
+
+try:
+    from jsonpath_ng.ext.parser import ExtendedJsonPathParser
+except ImportError:  # jsonpath-ng < 1.7 spells it ExtentedJsonPathParser
+    from jsonpath_ng.ext.parser import ExtentedJsonPathParser as ExtendedJsonPathParser
+
+# The extended grammar adds filters such as $.users[?(@.age > 25)]. Each
+# parse() still rebuilds the PLY tables, so compiled expressions are cached
+# by _compile_jsonpath.
+_PARSER = ExtendedJsonPathParser()
+
+# Delay before the history file is rewritten after a successful filter
+HISTORY_SAVE_DELAY_MS = 2000
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+
+
+@lru_cache(maxsize=256)
+def _compile_jsonpath(expression):
+    """Parse a JSONPath expression, reusing the result for repeated expressions
+
+    jsonpath-ng expressions are immutable, so one parsed instance can be
+    shared by every filter run.
+    """
+    return _PARSER.parse(expression)
+
+
+# Quick examples offered by the tool, as (expression, description)
+EXAMPLES = (
+    ("$.items[*]", "All items"),
+    ("$.user.name", "Field"),
+    ("$.users[0]", "Index"),
+    ("$.users[?(@.age > 25)]", "Filter"),
+    ("$..[name, email]", "Multi"),
+    ("$", "Root"),
+)
+
+# Parse the examples while the application starts rather than on the first
+# click, so the cache already holds them
+for _example in EXAMPLES:
+    try:
+        _compile_jsonpath(_example[0])
+    except (JsonPathLexerError, JsonPathParserError):
+        pass
+del _example
+
+
+# Expressions made only of $, .field, [index] and [*] steps
+_SIMPLE_PATH = re.compile(r'\$(?:\.[A-Za-z_]\w*|\[\d+\]|\[\*\])*')
+_SIMPLE_STEP = re.compile(r'\.([A-Za-z_]\w*)|\[(\d+|\*)\]')
+
+# Quote and bracket characters checked by _syntax_error; backticks delimit
+# named operators such as `len`
+_QUOTES = '\'"`'
+_CLOSING = {']': '[', ')': '('}
+
+# Inputs larger than this are filtered while they are parsed, without
+# building the whole document, when the expression is a chain of .field and
+# [*] steps with at least one [*], which map directly onto an ijson prefix
+STREAM_THRESHOLD = 4 << 20
+_STREAM_PATH = re.compile(r'\$(?:\.[A-Za-z_]\w*)*\[\*\](?:\.[A-Za-z_]\w*|\[\*\])*')
+
+
+def _syntax_error(expression):
+    """Find unbalanced brackets or quotes in a JSONPath expression
+
+    These are the most common typos and can never parse, so they are
+    reported without running the JSON parser or jsonpath-ng. Returns a
+    description of the problem, or None if the expression may be valid.
+    """
+    open_brackets = []
+    quote = None
+    escaped = False
+    for char in expression:
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in _QUOTES:
+            quote = char
+        elif char in _CLOSING:
+            if not open_brackets or open_brackets.pop() != _CLOSING[char]:
+                return f"unexpected '{char}'"
+        elif char in '[(':
+            open_brackets.append(char)
+
+    if quote:
+        return f"unterminated {quote} string"
+    if open_brackets:
+        return f"unclosed '{open_brackets[-1]}'"
+    return None
+
+
+def _fast_path(expression, data):
+    """Evaluate a simple dotted/indexed path with plain dict and list access
+
+    Returns the list of matched values, or None if the expression or the
+    data it walks needs jsonpath-ng.
+    """
+    if not _SIMPLE_PATH.fullmatch(expression):
+        return None
+
+    values = [data]
+    for field, index in _SIMPLE_STEP.findall(expression):
+        matched = []
+        for value in values:
+            if field:
+                if not isinstance(value, dict):
+                    return None
+                if field in value:
+                    matched.append(value[field])
+            elif isinstance(value, list):
+                if index == '*':
+                    matched.extend(value)
+                elif int(index) < len(value):
+                    matched.append(value[int(index)])
+            else:
+                return None
+        values = matched
+    return values
+
+
+class _NotStreamable(Exception):
+    """Raised by _check_events when the streamed matches would differ from
+    jsonpath-ng's
+    """
+
+
+def _check_events(events, array_prefixes, fields):
+    """Pass ijson parse events through, raising _NotStreamable if a value at
+    one of array_prefixes is not an array, or an object at a prefix in fields
+    repeats the key the path follows
+
+    [*] on an object or scalar selects the value itself in jsonpath-ng, and
+    the parsed document keeps only the last of duplicate keys, while the
+    ijson prefix would match nothing or every copy.
+    """
+    repeated = {}
+    for prefix, event, value in events:
+        if prefix in array_prefixes:
+            if event not in ('start_array', 'end_array'):
+                raise _NotStreamable
+        elif prefix in fields:
+            if event == 'start_map':
+                repeated[prefix] = False
+            elif event == 'map_key' and value == fields[prefix]:
+                if repeated[prefix]:
+                    raise _NotStreamable
+                repeated[prefix] = True
+        yield prefix, event, value
+
+
+def _stream_filter(raw, expression):
+    """Collect the values a .field/[*] path selects from UTF-8 encoded JSON
+    as the text is parsed
+
+    Returns the list of matched values, or None if ijson is unavailable, the
+    expression cannot be streamed, the input is invalid or its shape would
+    make the streamed matches differ from jsonpath-ng's; the regular parser
+    then runs instead.
+    """
+    if ijson is None or not _STREAM_PATH.fullmatch(expression):
+        return None
+
+    # $.a.b[*] is the ijson prefix "a.b.item", so a field named "item"
+    # would be taken for array elements
+    matches = _SIMPLE_STEP.findall(expression)
+    if any(field == 'item' for field, _ in matches):
+        return None
+    steps = [field or 'item' for field, _ in matches]
+    prefix = '.'.join(steps)
+
+    # Prefixes of the values [*] is applied to, and of the objects each
+    # .field step is looked up in, with that field
+    array_prefixes = set()
+    fields = {}
+    for position, (field, _) in enumerate(matches):
+        parent = '.'.join(steps[:position])
+        if field:
+            fields[parent] = field
+        else:
+            array_prefixes.add(parent)
+
+    try:
+        events = _check_events(
+            ijson.parse(io.BytesIO(raw), use_float=True), array_prefixes, fields
+        )
+        return list(ijson.items(events, prefix))
+    except (ijson.JSONError, UnicodeDecodeError, _NotStreamable):
+        return None
+
+
+def _format_results(results, max_results, max_output_chars, native=False):
+    """Pretty-print matched values, stopping once either limit is reached
+
+    A single match is shown as is and several as a JSON array. Each value is
+    serialized on its own so that no work is spent on values past the limits.
+    Returns (formatted text, number of values shown).
+    """
+    pieces = []
+    size = 0
+    for value in results[:max_results]:
+        piece = dumps(value, indent=2, native=native)
+        pieces.append(piece)
+        size += len(piece)
+        if size >= max_output_chars:
+            break
+
+    if len(results) == 1:
+        return pieces[0], 1
+
+    # Same layout as json.dumps(pieces, indent=2); JSON text has no raw line
+    # breaks inside strings, so indenting every line is safe
+    items = ",\n".join("  " + piece.replace("\n", "\n  ") for piece in pieces)
+    return f"[\n{items}\n]", len(pieces)
+
+
+class FilterCancelled(Exception):
+    """Raised inside a FilterWorker once its result is no longer wanted"""
+
+
+class FilterWorkerSignals(QObject):
+    """Signals emitted by FilterWorker back to the GUI thread"""
+
+    # worker, formatted output, text to copy, total matches, matches shown
+    finished = Signal(object, str, str, int, int)
+    failed = Signal(object, str)  # worker, status message
+
+
+class FilterWorker(QRunnable):
+    """Parses and filters JSON on the thread pool so large inputs don't block the UI"""
+
+    def __init__(self, input_data, expression, max_results, max_output_chars):
+        super().__init__()
+        self.input_data = input_data
+        self.expression = expression
+        self.max_results = max_results
+        self.max_output_chars = max_output_chars
+        # Set from the GUI thread; a plain attribute store is atomic
+        self.cancelled = False
+        self.signals = FilterWorkerSignals()
+
+    def check_cancelled(self):
+        """Abandon the run if the tool no longer wants its result"""
+        if self.cancelled:
+            raise FilterCancelled
+
+    def run(self):
+        """Parse the input, evaluate the expression and format the matches"""
+        try:
+            raw = self.input_data.encode('utf-8', 'surrogatepass')
+            self.input_data = None  # The encoded copy is all that is needed
+            results = None
+            native = False
+            if len(raw) > STREAM_THRESHOLD:
+                results = _stream_filter(raw, self.expression)
+
+            if results is None:
+                # Parse JSON
+                data, native = loads(raw)
+                del raw
+                self.check_cancelled()
+
+                # Simple paths are walked directly; anything else goes through jsonpath-ng
+                results = _fast_path(self.expression, data)
+
+            if results is None:
+                # Parse JSONPath expression
+                try:
+                    jsonpath_expr = _compile_jsonpath(self.expression)
+                except (JsonPathLexerError, JsonPathParserError) as e:
+                    self.signals.failed.emit(self, f"Invalid JSONPath: {str(e)}")
+                    return
+
+                # Execute filter and extract values
+                results = []
+                for match in jsonpath_expr.find(data):
+                    self.check_cancelled()
+                    results.append(match.value)
+            self.check_cancelled()
+
+            if not results:
+                self.signals.finished.emit(self, "", "", 0, 0)
+                return
+
+            # Format output, truncated for very large result sets
+            formatted, shown = _format_results(
+                results, self.max_results, self.max_output_chars, native
+            )
+            # Truncated output is copied in full, compact to keep it cheap
+            copy_text = formatted
+            if shown < len(results):
+                copy_text = dumps(results, native=native)
+            self.signals.finished.emit(self, formatted, copy_text, len(results), shown)
+        except FilterCancelled:
+            pass
+        except json.JSONDecodeError as e:
+            self.signals.failed.emit(self, f"Invalid JSON: {str(e)}")
+        except Exception as e:
+            self.signals.failed.emit(self, f"Error: {str(e)}")
 
 
 class JsonPathFilterTool(QWidget):
@@ -20,10 +337,23 @@ class JsonPathFilterTool(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.history = []
+        self.history = OrderedDict()  # Expression -> None, most recent last
         self.max_history = 20
+        self.max_results = 10000
+        self.max_output_chars = 2 * 1024 * 1024
+        self._worker = None  # FilterWorker whose result is still wanted
+        self._last_output = ""  # Text copied by copy_result
         self.history_file = Path.home() / '.qdevkit_jsonpath_history.json'
         self.load_history()
+
+        # Successive filters are written to the history file in one go
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(HISTORY_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_history)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_history)
         self.setup_ui()
 
     def setup_ui(self):
@@ -46,7 +376,7 @@ class JsonPathFilterTool(QWidget):
 
         # Title
         title = QLabel("JSON Path Filter")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -58,25 +388,25 @@ class JsonPathFilterTool(QWidget):
 
         # Input section
         input_label = QLabel("Input JSON:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
-        self.input_text = QTextEdit()
+        self.input_text = QPlainTextEdit()
         self.input_text.setPlaceholderText("Paste your JSON here...")
         self.input_text.setMinimumHeight(120)
         self.input_text.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
         layout.addWidget(self.input_text)
 
         # Expression input section
         expr_label = QLabel("JSONPath Expression:")
-        expr_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        expr_label.setFont(_LABEL_FONT)
         layout.addWidget(expr_label)
 
         expr_layout = QHBoxLayout()
         self.expr_input = QLineEdit()
         self.expr_input.setPlaceholderText("$")
-        self.expr_input.setFont(QFont("Consolas", 10))
+        self.expr_input.setFont(_MONO_FONT)
         expr_layout.addWidget(self.expr_input)
 
         self.apply_expr_btn = QPushButton("Apply")
@@ -93,16 +423,7 @@ class JsonPathFilterTool(QWidget):
         examples_layout.setSpacing(3)
         examples_layout.setContentsMargins(8, 12, 8, 8)
 
-        examples = [
-            ("$.items[*]", "All items"),
-            ("$.user.name", "Field"),
-            ("$.users[0]", "Index"),
-            ("$.users[?(@.age > 25)]", "Filter"),
-            ("$..[name, email]", "Multi"),
-            ("$", "Root"),
-        ]
-
-        for i, (expr, desc) in enumerate(examples):
+        for i, (expr, desc) in enumerate(EXAMPLES):
             row = i // 2
             col = (i % 2) * 2
             example_btn = QPushButton(f"{expr}")
@@ -120,7 +441,7 @@ class JsonPathFilterTool(QWidget):
 
         # History section
         history_label = QLabel("Recent Expressions:")
-        history_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        history_label.setFont(_LABEL_FONT)
         layout.addWidget(history_label)
 
         self.history_combo = QComboBox()
@@ -153,19 +474,19 @@ class JsonPathFilterTool(QWidget):
 
         # Output section
         output_label = QLabel("Filtered Result:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(120)
         self.output_text.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
-        self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setFont(_MONO_FONT)
         layout.addWidget(self.output_text)
 
         # Status bar
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; padding: 5px;")
+        self.status_label.setStyleSheet(STATUS_STYLE)
         layout.addWidget(self.status_label)
 
         # Set scroll content
@@ -177,60 +498,9 @@ class JsonPathFilterTool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#copyButton {
-                background-color: #107c10;
-            }
-            QPushButton#copyButton:hover {
-                background-color: #0c5c0c;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.filter_btn.setStyleSheet(button_style)
-        self.apply_expr_btn.setStyleSheet(button_style)
-        self.copy_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#copyButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
-
-        # Example buttons style
-        example_style = """
-            QPushButton {
-                background-color: #f5f5f5;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 6px 10px;
-                font-size: 11px;
-                font-family: Consolas;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #e5e5e5;
-                border-color: #0078d4;
-            }
-        """
-        # Apply to all child buttons in the examples group
-        for child in self.findChildren(QPushButton):
-            if child not in [self.filter_btn, self.apply_expr_btn, self.copy_btn, self.clear_btn]:
-                child.setStyleSheet(example_style)
+        self.copy_btn.setObjectName("copyButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE + EXAMPLE_BUTTON_STYLE)
 
     def filter_json(self):
         """Execute JSONPath filter on input JSON"""
@@ -238,94 +508,96 @@ class JsonPathFilterTool(QWidget):
         expression = self.expr_input.text().strip()
 
         if not input_data:
-            self.status_label.setText("⚠️  Please enter JSON data")
-            self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+            set_status(self.status_label, "⚠️  Please enter JSON data", 'warn')
             return
 
         if not expression:
-            self.status_label.setText("⚠️  Please enter a JSONPath expression")
-            self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+            set_status(self.status_label, "⚠️  Please enter a JSONPath expression", 'warn')
             return
 
-        try:
-            # Parse JSON
-            data = json.loads(input_data)
-
-            # Parse JSONPath expression
-            try:
-                jsonpath_expr = parse(expression)
-            except JsonPathParserError as e:
-                self.output_text.setPlainText("")
-                self.status_label.setText(f"❌ Invalid JSONPath: {str(e)}")
-                self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
-                return
+        error = _syntax_error(expression)
+        if error:
+            self.show_output("")
+            set_status(self.status_label, f"❌ Invalid JSONPath: {error}", 'error')
+            return
 
-            # Execute filter
-            matches = jsonpath_expr.find(data)
+        worker = FilterWorker(input_data, expression, self.max_results, self.max_output_chars)
+        worker.signals.finished.connect(self.on_filter_finished)
+        worker.signals.failed.connect(self.on_filter_failed)
+        self._worker = worker
+
+        self.filter_btn.setEnabled(False)
+        self.apply_expr_btn.setEnabled(False)
+        set_status(self.status_label, "⏳ Filtering...", 'busy')
+        QThreadPool.globalInstance().start(worker)
+
+    def on_filter_finished(self, worker, formatted, copy_text, total, shown):
+        """Show the values matched by the worker"""
+        if worker is not self._worker:
+            return  # Superseded or cleared while filtering
+        self.finish_filter()
+
+        if not total:
+            self.show_output("[]")
+            set_status(self.status_label, "ℹ️  No matches found for this expression", 'info')
+            return
 
-            if not matches:
-                self.output_text.setPlainText("[]")
-                self.status_label.setText("ℹ️  No matches found for this expression")
-                self.status_label.setStyleSheet("color: #17a2b8; padding: 5px;")
-            else:
-                # Extract values
-                results = [match.value for match in matches]
-
-                # Format output
-                if len(results) == 1:
-                    # Single match - display directly
-                    formatted = json.dumps(results[0], indent=2, ensure_ascii=False)
-                    match_info = "1 match"
-                else:
-                    # Multiple matches - display as array
-                    formatted = json.dumps(results, indent=2, ensure_ascii=False)
-                    match_info = f"{len(results)} matches"
-
-                self.output_text.setPlainText(formatted)
-                self.status_label.setText(f"✅ Found {match_info}")
-                self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
-
-                # Add to history on success
-                self.add_to_history(expression)
+        match_info = "1 match" if total == 1 else f"{total} matches"
+        if shown < total:
+            match_info += f" (showing first {shown}, copy to get all)"
 
-        except json.JSONDecodeError as e:
-            self.output_text.setPlainText("")
-            self.status_label.setText(f"❌ Invalid JSON: {str(e)}")
-            self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
-        except Exception as e:
-            self.output_text.setPlainText("")
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
+        self.show_output(formatted, copy_text)
+        set_status(self.status_label, f"✅ Found {match_info}", 'success')
+
+        # Add to history on success
+        self.add_to_history(worker.expression)
+
+    def on_filter_failed(self, worker, message):
+        """Report a parse or filter error from the worker"""
+        if worker is not self._worker:
+            return
+        self.finish_filter()
+        self.show_output("")
+        set_status(self.status_label, f"❌ {message}", 'error')
+
+    def show_output(self, text, copy_text=None):
+        """Display text in the output view, keeping it or copy_text for copy_result"""
+        self._last_output = text if copy_text is None else copy_text
+        self.output_text.setPlainText(text)
+
+    def finish_filter(self):
+        """Forget the running worker and re-enable the filter buttons"""
+        self._worker = None
+        self.filter_btn.setEnabled(True)
+        self.apply_expr_btn.setEnabled(True)
 
     def use_example(self, expression):
         """Insert example expression into input field"""
         self.expr_input.setText(expression)
-        self.status_label.setText(f"ℹ️  Example loaded: {expression}")
-        self.status_label.setStyleSheet("color: #17a2b8; padding: 5px;")
+        set_status(self.status_label, f"ℹ️  Example loaded: {expression}", 'info')
 
     def add_to_history(self, expression):
         """Add expression to history with LRU eviction"""
-        # Remove if already exists
-        if expression in self.history:
-            self.history.remove(expression)
-
-        # Add to front
-        self.history.insert(0, expression)
+        # Add or move to the most recent end
+        self.history[expression] = None
+        self.history.move_to_end(expression)
 
         # Trim to max
-        if len(self.history) > self.max_history:
-            self.history = self.history[:self.max_history]
+        while len(self.history) > self.max_history:
+            self.history.popitem(last=False)
 
         # Update UI and save
         self.update_history_ui()
-        self.save_history()
+        self._save_timer.start()
 
     def update_history_ui(self):
         """Update the history combo box"""
+        # Rebuilding the list must not load the placeholder or an
+        # expression into the input as if the user had picked it
+        self.history_combo.blockSignals(True)
         self.history_combo.clear()
-        self.history_combo.addItem("-- Select recent expression --")
-        for expr in self.history:
-            self.history_combo.addItem(expr)
+        self.history_combo.addItems(["-- Select recent expression --", *reversed(self.history)])
+        self.history_combo.blockSignals(False)
 
     def on_history_selected(self, text):
         """Handle history selection"""
@@ -339,38 +611,48 @@ class JsonPathFilterTool(QWidget):
                 with open(self.history_file, 'r') as f:
                     data = json.load(f)
                     if isinstance(data, dict) and 'history' in data:
-                        self.history = data['history']
-                    elif isinstance(data, list):
-                        self.history = data
-        except (json.JSONDecodeError, IOError):
+                        data = data['history']
+                    if isinstance(data, list):
+                        # The file lists the most recent expression first
+                        self.history = OrderedDict.fromkeys(reversed(data))
+        except (json.JSONDecodeError, IOError, TypeError):
             # Start with empty history if file is corrupted
-            self.history = []
+            self.history = OrderedDict()
 
     def save_history(self):
         """Save history to JSON file"""
         try:
             data = {
                 'version': 1,
-                'history': self.history
+                'history': list(reversed(self.history))
             }
-            with open(self.history_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Written to a temporary file and renamed over the old one, so a
+            # crash mid-write never leaves a truncated history behind
+            tmp_file = self.history_file.with_suffix('.tmp')
+            tmp_file.write_text(json.dumps(data, indent=2))
+            os.replace(tmp_file, self.history_file)
         except IOError:
             # Silently fail if we can't save history
             pass
 
+    def flush_history(self):
+        """Save history now if a save is still pending"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_history()
+
     def copy_result(self):
         """Copy filtered result to clipboard"""
-        result_text = self.output_text.toPlainText()
-        if result_text:
-            self.output_text.selectAll()
-            self.output_text.copy()
-            self.status_label.setText("✅ Result copied to clipboard")
-            self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
+        if self._last_output:
+            QGuiApplication.clipboard().setText(self._last_output)
+            set_status(self.status_label, "✅ Result copied to clipboard", 'success')
 
     def clear_all(self):
         """Clear all fields"""
+        if self._worker is not None:
+            self._worker.cancelled = True
+            self.finish_filter()
         self.input_text.clear()
         self.expr_input.setText("")
-        self.output_text.clear()
+        self.show_output("")
         self.status_label.setText("")
@@ -2,17 +2,44 @@
 JWT Decoder Tool
 """
 
-import json
 import base64
 import hashlib
-from datetime import datetime
+import time
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton,
     QLabel, QGroupBox, QScrollArea
 )
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
+from tools._json import dumps, loads
+from tools._styles import BUTTON_STYLE, STATUS_STYLE, set_status
+
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+_SMALL_MONO_FONT = QFont("Consolas", 9)
+_INFO_FONT = QFont("Arial", 9)
+
+
+def _format_timestamp(timestamp):
+    """Format a NumericDate claim as local time"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp))
+
+
+# Payload claims shown in the token information, in display order
+_CLAIM_INFO = (
+    ("Issuer", 'iss', str),
+    ("Subject", 'sub', str),
+    ("Audience", 'aud', str),
+    ("Expires", 'exp', _format_timestamp),
+    ("Not Before", 'nbf', _format_timestamp),
+    ("Issued At", 'iat', _format_timestamp),
+    ("JWT ID", 'jti', str),
+)
+
 
 class JwtDecoderTool(QWidget):
     """Tool for decoding JWT tokens"""
@@ -29,7 +56,7 @@ class JwtDecoderTool(QWidget):
 
         # Title
         title = QLabel("JWT Decoder")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -41,13 +68,13 @@ class JwtDecoderTool(QWidget):
 
         # Input section
         input_label = QLabel("JWT Token:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
-        self.input_text = QTextEdit()
+        self.input_text = QPlainTextEdit()
         self.input_text.setPlaceholderText("Paste your JWT token here...")
         self.input_text.setMaximumHeight(100)
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
         layout.addWidget(self.input_text)
 
         # Buttons
@@ -98,7 +125,7 @@ class JwtDecoderTool(QWidget):
 
         # Status bar
         self.status_label = QLabel("")
-        self.status_label.setStyleSheet("color: #666; padding: 5px;")
+        self.status_label.setStyleSheet(STATUS_STYLE)
         layout.addWidget(self.status_label)
 
         # Apply button styles
@@ -107,13 +134,13 @@ class JwtDecoderTool(QWidget):
     def create_section(self, title, content):
         """Create a collapsible group box section"""
         group = QGroupBox(title)
-        group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        group.setFont(_LABEL_FONT)
         layout = QVBoxLayout(group)
 
-        text_edit = QTextEdit()
+        text_edit = QPlainTextEdit()
         text_edit.setReadOnly(True)
         text_edit.setMaximumHeight(150)
-        text_edit.setFont(QFont("Consolas", 9))
+        text_edit.setFont(_SMALL_MONO_FONT)
         text_edit.setPlainText(content)
 
         layout.addWidget(text_edit)
@@ -122,50 +149,27 @@ class JwtDecoderTool(QWidget):
     def create_info_section(self):
         """Create token information section"""
         group = QGroupBox("Token Information")
-        group.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        group.setFont(_LABEL_FONT)
         layout = QVBoxLayout(group)
 
         self.info_label = QLabel("No token decoded yet")
         self.info_label.setWordWrap(True)
-        self.info_label.setFont(QFont("Arial", 9))
+        self.info_label.setFont(_INFO_FONT)
 
         layout.addWidget(self.info_label)
         return group
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.decode_btn.setStyleSheet(button_style)
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
 
     def base64_decode(self, data):
-        """Base64 decode with padding fix"""
+        """Base64 decode bytes with padding fix"""
         # Add padding if needed
-        missing_padding = len(data) % 4
+        missing_padding = -len(data) & 3
         if missing_padding:
-            data += '=' * (4 - missing_padding)
+            data += b'=' * missing_padding
 
         return base64.urlsafe_b64decode(data)
 
@@ -174,97 +178,68 @@ class JwtDecoderTool(QWidget):
         token = self.input_text.toPlainText().strip()
 
         if not token:
-            self.status_label.setText("⚠️  Please enter a JWT token")
-            self.status_label.setStyleSheet("color: #f0ad4e; padding: 5px;")
+            set_status(self.status_label, "⚠️  Please enter a JWT token", 'warn')
             return
 
         try:
-            parts = token.split('.')
+            # JWT segments are ASCII; working in bytes saves the decoder
+            # re-encoding each one, and a bounded split stops early on
+            # tokens with many dots
+            try:
+                raw = token.encode('ascii')
+            except UnicodeEncodeError:
+                raise ValueError("Invalid JWT format. Tokens contain only ASCII characters.") from None
+            parts = raw.split(b'.', 3)
 
             if len(parts) != 3:
                 raise ValueError("Invalid JWT format. Expected 3 parts separated by dots.")
 
             # Decode header
             header_decoded = self.base64_decode(parts[0])
-            header_json = json.loads(header_decoded)
-            header_formatted = json.dumps(header_json, indent=2)
+            header_json, native = loads(header_decoded)
+            header_formatted = dumps(header_json, indent=2, native=native)
 
             # Update header section
             self.update_section_text(self.header_group, header_formatted)
 
             # Decode payload
             payload_decoded = self.base64_decode(parts[1])
-            payload_json = json.loads(payload_decoded)
-            payload_formatted = json.dumps(payload_json, indent=2)
+            payload_json, native = loads(payload_decoded)
+            payload_formatted = dumps(payload_json, indent=2, native=native)
 
             # Update payload section
             self.update_section_text(self.payload_group, payload_formatted)
 
             # Signature (can't decode, just show)
-            signature = parts[2]
+            signature = parts[2].decode('ascii')
             self.update_section_text(self.signature_group, signature)
 
             # Extract token information
             info_text = self.extract_token_info(header_json, payload_json)
             self.info_label.setText(info_text)
 
-            self.status_label.setText("✅ JWT decoded successfully")
-            self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
+            set_status(self.status_label, "✅ JWT decoded successfully", 'success')
 
         except Exception as e:
-            self.status_label.setText(f"❌ Error: {str(e)}")
-            self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
+            set_status(self.status_label, f"❌ Error: {str(e)}", 'error')
 
     def update_section_text(self, group, text):
         """Update the text content of a section"""
-        text_edit = group.findChild(QTextEdit)
+        text_edit = group.findChild(QPlainTextEdit)
         if text_edit:
             text_edit.setPlainText(text)
 
     def extract_token_info(self, header, payload):
         """Extract and display token information"""
-        info_lines = []
-
-        # Algorithm
         alg = header.get('alg', 'N/A')
         typ = header.get('typ', 'N/A')
-        info_lines.append(f"<b>Algorithm:</b> {alg} | <b>Type:</b> {typ}")
-
-        # Issuer
-        if 'iss' in payload:
-            info_lines.append(f"<b>Issuer:</b> {payload['iss']}")
-
-        # Subject
-        if 'sub' in payload:
-            info_lines.append(f"<b>Subject:</b> {payload['sub']}")
-
-        # Audience
-        if 'aud' in payload:
-            info_lines.append(f"<b>Audience:</b> {payload['aud']}")
-
-        # Expiration
-        if 'exp' in payload:
-            exp_timestamp = payload['exp']
-            exp_datetime = datetime.fromtimestamp(exp_timestamp)
-            info_lines.append(f"<b>Expires:</b> {exp_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # Not Before
-        if 'nbf' in payload:
-            nbf_timestamp = payload['nbf']
-            nbf_datetime = datetime.fromtimestamp(nbf_timestamp)
-            info_lines.append(f"<b>Not Before:</b> {nbf_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # Issued At
-        if 'iat' in payload:
-            iat_timestamp = payload['iat']
-            iat_datetime = datetime.fromtimestamp(iat_timestamp)
-            info_lines.append(f"<b>Issued At:</b> {iat_datetime.strftime('%Y-%m-%d %H:%M:%S')}")
-
-        # JWT ID
-        if 'jti' in payload:
-            info_lines.append(f"<b>JWT ID:</b> {payload['jti']}")
-
-        return '<br>'.join(info_lines)
+        lines = [f"<b>Algorithm:</b> {alg} | <b>Type:</b> {typ}"]
+        lines.extend(
+            f"<b>{label}:</b> {format_value(payload[claim])}"
+            for label, claim, format_value in _CLAIM_INFO
+            if claim in payload
+        )
+        return '<br>'.join(lines)
 
     def clear_all(self):
         """Clear all fields"""
@@ -2,14 +2,83 @@
 Timestamp Converter Tool
 """
 
+import re
+import time
 from datetime import datetime, timezone
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QLineEdit, QTextEdit, QRadioButton, QButtonGroup, QFrame
 )
-from PySide6.QtCore import Qt, QDateTime
+from PySide6.QtCore import Qt, QDateTime, QTimer, Slot
 from PySide6.QtGui import QFont
 
+from tools._styles import BUTTON_STYLE
+
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+_LARGE_MONO_FONT = QFont("Consolas", 11)
+
+
+# Timestamp to date output formats, one per line: UTC, RFC 2822 and the
+# three additional formats
+_TO_DATE_FORMATS = '\n'.join((
+    '%Y-%m-%d %H:%M:%S',
+    '%a, %d %b %Y %H:%M:%S GMT',
+    '%Y-%m-%d',
+    '%d/%m/%Y %H:%M:%S',
+    '%A, %B %d, %Y',
+))
+
+# Year-first dates with an optional time, the most common input, also
+# accepting a T separator
+_YEAR_FIRST_DATE = re.compile(
+    r'(\d{4})([-/])(\d{1,2})\2(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2}):(\d{1,2}))?'
+)
+
+# The other accepted date shapes and the strptime format each one needs
+_DATE_FORMATS = tuple(
+    (re.compile(pattern), fmt)
+    for pattern, fmt in (
+        (r'\d{1,2}/\d{1,2}/\d{4}', '%d/%m/%Y'),
+        (r'\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{1,2}:\d{1,2}', '%d/%m/%Y %H:%M:%S'),
+        (r'\d{1,2}-\d{1,2}-\d{4}', '%d-%m-%Y'),
+        (r'\d{1,2}-\d{1,2}-\d{4} \d{1,2}:\d{1,2}:\d{1,2}', '%d-%m-%Y %H:%M:%S'),
+        (r'[A-Za-z]+ \d{1,2}, \d{4}', '%B %d, %Y'),
+        (r'[A-Za-z]+ \d{1,2}, \d{4} \d{1,2}:\d{1,2}:\d{1,2}', '%B %d, %Y %H:%M:%S'),
+    )
+)
+
+
+def _parse_date(text):
+    """Parse a year-first, day-first or month-name date, or ISO 8601
+
+    Year-first dates are built directly from one regex match, and the other
+    shapes are matched to the single strptime format that can parse them,
+    so no parse is attempted just to fail. fromisoformat handles the rest.
+    """
+    try:
+        match = _YEAR_FIRST_DATE.fullmatch(text)
+        if match:
+            year, _, month, day, hour, minute, second = match.groups('0')
+            return datetime(
+                int(year), int(month), int(day), int(hour), int(minute), int(second)
+            )
+
+        for pattern, fmt in _DATE_FORMATS:
+            if pattern.fullmatch(text):
+                return datetime.strptime(text, fmt)
+
+        return datetime.fromisoformat(text.replace('Z', '+00:00'))
+    except ValueError:
+        # Out-of-range values in a recognised shape get the same hint
+        raise ValueError(
+            "Could not parse date. Try formats like: "
+            "2024-01-15, 2024-01-15 14:30:00, or ISO 8601"
+        ) from None
+
 
 class TimestampConverter(QWidget):
     """Tool for converting between timestamps and datetime strings"""
@@ -26,7 +95,7 @@ class TimestampConverter(QWidget):
 
         # Title
         title = QLabel("Timestamp Converter")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -47,11 +116,11 @@ class TimestampConverter(QWidget):
         current_layout = QVBoxLayout(current_frame)
 
         current_label = QLabel("Current Timestamp:")
-        current_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        current_label.setFont(_LABEL_FONT)
         current_layout.addWidget(current_label)
 
         self.current_timestamp_label = QLabel("")
-        self.current_timestamp_label.setFont(QFont("Consolas", 11))
+        self.current_timestamp_label.setFont(_LARGE_MONO_FONT)
         current_layout.addWidget(self.current_timestamp_label)
 
         layout.addWidget(current_frame)
@@ -59,7 +128,7 @@ class TimestampConverter(QWidget):
         # Conversion mode
         mode_layout = QHBoxLayout()
         mode_label = QLabel("Convert:")
-        mode_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        mode_label.setFont(_LABEL_FONT)
         mode_layout.addWidget(mode_label)
 
         self.mode_group = QButtonGroup()
@@ -77,19 +146,19 @@ class TimestampConverter(QWidget):
 
         # Input section
         input_label = QLabel("Input:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
         self.input_text = QLineEdit()
         self.input_text.setPlaceholderText("Enter timestamp or date...")
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
         self.input_text.setMinimumHeight(35)
         layout.addWidget(self.input_text)
 
         # Timestamp unit selection (for timestamp to date)
         unit_layout = QHBoxLayout()
         unit_label = QLabel("Timestamp Unit:")
-        unit_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        unit_label.setFont(_LABEL_FONT)
         unit_layout.addWidget(unit_label)
 
         self.unit_group = QButtonGroup()
@@ -127,13 +196,13 @@ class TimestampConverter(QWidget):
 
         # Output section
         output_label = QLabel("Result:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(150)
-        self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setFont(_MONO_FONT)
         layout.addWidget(self.output_text)
 
         # Status bar
@@ -146,53 +215,31 @@ class TimestampConverter(QWidget):
         # Apply button styles
         self.apply_button_styles()
 
-        # Update current timestamp
+        # Update current timestamp, keeping it live with a single timer
         self.update_current_timestamp()
+        self._clock_timer = QTimer(self)
+        self._clock_timer.setInterval(1000)
+        self._clock_timer.timeout.connect(self.update_current_timestamp)
+        self._clock_timer.start()
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#nowButton {
-                background-color: #107c10;
-            }
-            QPushButton#nowButton:hover {
-                background-color: #0c5c0c;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.convert_btn.setStyleSheet(button_style)
-        self.now_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#nowButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        self.now_btn.setObjectName("nowButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
 
+    @Slot()
     def update_current_timestamp(self):
         """Update the current timestamp display"""
-        now = datetime.now(timezone.utc)
-        timestamp_sec = int(now.timestamp())
-        timestamp_ms = int(now.timestamp() * 1000)
+        # One clock read serves both units without building a datetime
+        now = time.time()
+        timestamp_sec = int(now)
+        timestamp_ms = int(now * 1000)
 
         display_text = f"Seconds: {timestamp_sec} | Milliseconds: {timestamp_ms}"
         self.current_timestamp_label.setText(display_text)
 
+    @Slot()
     def convert(self):
         """Perform the conversion"""
         input_data = self.input_text.text().strip()
@@ -205,8 +252,13 @@ class TimestampConverter(QWidget):
         try:
             if self.to_date_radio.isChecked():
                 # Timestamp to Date
+                # Whole numbers, the usual case, are parsed exactly as ints;
+                # only fractional or exponent forms go through float
                 try:
-                    timestamp = float(input_data)
+                    if input_data.lstrip('-').isdigit():
+                        timestamp = int(input_data)
+                    else:
+                        timestamp = float(input_data)
                 except ValueError:
                     raise ValueError("Invalid timestamp format")
 
@@ -222,18 +274,21 @@ class TimestampConverter(QWidget):
                     dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
                     unit = "seconds"
 
-                # Format output
+                # Format output, rendering every strftime field in one call
+                utc, rfc_2822, date_only, date_slash, date_long = dt.strftime(
+                    _TO_DATE_FORMATS
+                ).split('\n')
                 result_lines = [
                     f"Input: {input_data} ({unit})",
                     "",
-                    f"UTC: {dt.strftime('%Y-%m-%d %H:%M:%S')} UTC",
+                    f"UTC: {utc} UTC",
                     f"ISO 8601: {dt.isoformat()}",
-                    f"RFC 2822: {dt.strftime('%a, %d %b %Y %H:%M:%S GMT')}",
+                    f"RFC 2822: {rfc_2822}",
                     "",
                     "Additional formats:",
-                    f"  {dt.strftime('%Y-%m-%d')}",
-                    f"  {dt.strftime('%d/%m/%Y %H:%M:%S')}",
-                    f"  {dt.strftime('%A, %B %d, %Y')}",
+                    f"  {date_only}",
+                    f"  {date_slash}",
+                    f"  {date_long}",
                 ]
 
                 self.output_text.setPlainText('\n'.join(result_lines))
@@ -242,45 +297,16 @@ class TimestampConverter(QWidget):
 
             else:
                 # Date to Timestamp
-                # Try common date formats
-                formats = [
-                    '%Y-%m-%d %H:%M:%S',
-                    '%Y-%m-%d',
-                    '%Y/%m/%d %H:%M:%S',
-                    '%Y/%m/%d',
-                    '%d/%m/%Y %H:%M:%S',
-                    '%d/%m/%Y',
-                    '%d-%m-%Y %H:%M:%S',
-                    '%d-%m-%Y',
-                    '%B %d, %Y %H:%M:%S',
-                    '%B %d, %Y',
-                ]
-
-                dt = None
-                for fmt in formats:
-                    try:
-                        dt = datetime.strptime(input_data, fmt)
-                        break
-                    except ValueError:
-                        continue
-
-                if dt is None:
-                    # Try ISO format
-                    try:
-                        dt = datetime.fromisoformat(input_data.replace('Z', '+00:00'))
-                    except ValueError:
-                        raise ValueError(
-                            "Could not parse date. Try formats like: "
-                            "2024-01-15, 2024-01-15 14:30:00, or ISO 8601"
-                        )
+                dt = _parse_date(input_data)
 
                 # Make timezone-aware if not
                 if dt.tzinfo is None:
                     dt = dt.replace(tzinfo=timezone.utc)
 
                 # Calculate timestamps
-                timestamp_sec = int(dt.timestamp())
-                timestamp_ms = int(dt.timestamp() * 1000)
+                timestamp = dt.timestamp()
+                timestamp_sec = int(timestamp)
+                timestamp_ms = int(timestamp * 1000)
 
                 result_lines = [
                     f"Input: {input_data}",
@@ -301,17 +327,17 @@ class TimestampConverter(QWidget):
             self.status_label.setText(f"❌ Error: {str(e)}")
             self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
 
+    @Slot()
     def insert_current_time(self):
         """Insert current time/date based on mode"""
-        now = datetime.now(timezone.utc)
-
         if self.to_date_radio.isChecked():
             # Insert current timestamp
-            self.input_text.setText(str(int(now.timestamp())))
+            self.input_text.setText(str(int(time.time())))
         else:
             # Insert current date
-            self.input_text.setText(now.strftime('%Y-%m-%d %H:%M:%S'))
+            self.input_text.setText(datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S'))
 
+    @Slot()
     def clear_all(self):
         """Clear all fields"""
         self.input_text.clear()
@@ -2,20 +2,33 @@
 URL Encoder/Decoder Tool
 """
 
-from urllib.parse import quote, unquote
+import re
+from urllib.parse import quote, quote_plus, unquote, unquote_plus
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, QPushButton,
     QLabel, QRadioButton, QButtonGroup, QCheckBox
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 from PySide6.QtGui import QFont
 
+from tools._styles import BUTTON_STYLE
+
+
+# Characters quote() changes with safe=''; text without any is already encoded
+_NEEDS_QUOTING = re.compile(r'[^A-Za-z0-9_.~-]')
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_MONO_FONT = QFont("Consolas", 10)
+
 
 class UrlEncoderTool(QWidget):
     """Tool for URL encoding and decoding"""
 
     def __init__(self):
         super().__init__()
+        self._last_output = ""  # Text shown in the read-only output view
         self.setup_ui()
 
     def setup_ui(self):
@@ -26,7 +39,7 @@ class UrlEncoderTool(QWidget):
 
         # Title
         title = QLabel("URL Encoder / Decoder")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -38,7 +51,7 @@ class UrlEncoderTool(QWidget):
         # Mode selection
         mode_layout = QHBoxLayout()
         mode_label = QLabel("Mode:")
-        mode_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        mode_label.setFont(_LABEL_FONT)
         mode_layout.addWidget(mode_label)
 
         self.mode_group = QButtonGroup()
@@ -65,13 +78,13 @@ class UrlEncoderTool(QWidget):
 
         # Input section
         input_label = QLabel("Input:")
-        input_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        input_label.setFont(_LABEL_FONT)
         layout.addWidget(input_label)
 
         self.input_text = QTextEdit()
         self.input_text.setPlaceholderText("Enter URL or text to encode/decode...")
         self.input_text.setMinimumHeight(120)
-        self.input_text.setFont(QFont("Consolas", 10))
+        self.input_text.setFont(_MONO_FONT)
         layout.addWidget(self.input_text)
 
         # Buttons
@@ -96,13 +109,13 @@ class UrlEncoderTool(QWidget):
 
         # Output section
         output_label = QLabel("Output:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
         self.output_text = QTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(120)
-        self.output_text.setFont(QFont("Consolas", 10))
+        self.output_text.setFont(_MONO_FONT)
         layout.addWidget(self.output_text)
 
         # Status bar
@@ -117,39 +130,11 @@ class UrlEncoderTool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#swapButton {
-                background-color: #5c2d91;
-            }
-            QPushButton#swapButton:hover {
-                background-color: #44226b;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
-        """
-        self.convert_btn.setStyleSheet(button_style)
-        self.swap_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#swapButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        self.swap_btn.setObjectName("swapButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
 
+    @Slot()
     def convert(self):
         """Perform encode or decode based on selected mode"""
         input_data = self.input_text.toPlainText()
@@ -162,14 +147,15 @@ class UrlEncoderTool(QWidget):
         try:
             if self.encode_radio.isChecked():
                 # Encode
-                if self.safe_chars_cb.isChecked():
+                if not _NEEDS_QUOTING.search(input_data):
+                    encoded = input_data
+                elif self.safe_chars_cb.isChecked():
                     # Use '+' for spaces
-                    encoded = quote(input_data, safe='')
-                    encoded = encoded.replace('%20', '+')
+                    encoded = quote_plus(input_data, safe='')
                 else:
                     encoded = quote(input_data, safe='')
 
-                self.output_text.setPlainText(encoded)
+                self.show_output(encoded)
                 input_len = len(input_data)
                 output_len = len(encoded)
                 self.status_label.setText(
@@ -177,11 +163,16 @@ class UrlEncoderTool(QWidget):
                 )
             else:
                 # Decode
-                if self.safe_chars_cb.isChecked():
-                    # First replace '+' with spaces
-                    input_data = input_data.replace('+', ' ')
-                decoded = unquote(input_data)
-                self.output_text.setPlainText(decoded)
+                if '%' not in input_data and not (
+                    self.safe_chars_cb.isChecked() and '+' in input_data
+                ):
+                    decoded = input_data
+                elif self.safe_chars_cb.isChecked():
+                    # '+' decodes to a space
+                    decoded = unquote_plus(input_data)
+                else:
+                    decoded = unquote(input_data)
+                self.show_output(decoded)
                 input_len = len(input_data)
                 output_len = len(decoded)
                 self.status_label.setText(
@@ -189,18 +180,27 @@ class UrlEncoderTool(QWidget):
                 )
             self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
         except Exception as e:
-            self.output_text.setPlainText("")
+            self.show_output("")
             self.status_label.setText(f"❌ Error: {str(e)}")
             self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
 
+    def show_output(self, text):
+        """Display text in the output view, keeping it for swap"""
+        # Converting the same input again must not rebuild the document
+        if text == self._last_output:
+            return
+        self._last_output = text
+        self.output_text.setPlainText(text)
+
+    @Slot()
     def swap(self):
         """Swap input and output"""
-        output_data = self.output_text.toPlainText()
-        if output_data:
-            self.input_text.setPlainText(output_data)
+        if self._last_output:
+            self.input_text.setPlainText(self._last_output)
 
+    @Slot()
     def clear_all(self):
         """Clear all fields"""
         self.input_text.clear()
-        self.output_text.clear()
+        self.show_output("")
         self.status_label.setText("")
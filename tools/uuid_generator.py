@@ -3,14 +3,37 @@ UUID Generator Tool
 Supports UUID v4 and v7
 """
 
-import uuid
+import os
+import re
 import time
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
-    QRadioButton, QButtonGroup, QSpinBox, QTextEdit, QCheckBox
+    QRadioButton, QButtonGroup, QSpinBox, QPlainTextEdit, QCheckBox
 )
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QFontMetrics
+from PySide6.QtCore import Qt, QTimer, Slot
+from PySide6.QtGui import QFont, QFontMetrics, QGuiApplication
+
+from tools._styles import BUTTON_STYLE
+
+
+# Translation tables setting the version nibble of byte 6 and the RFC 4122
+# variant bits of byte 8
+_VERSION_BITS = {
+    version: bytes(byte & 0x0F | version << 4 for byte in range(256))
+    for version in (4, 7)
+}
+_VARIANT_BITS = bytes(byte & 0x3F | 0x80 for byte in range(256))
+
+# Splits the hex digits of one UUID into its five groups; the templates
+# rejoin them with or without dashes and end each UUID with a newline
+_UUID_HEX = re.compile(r'(.{8})(.{4})(.{4})(.{4})(.{12})')
+_UUID_DASHED = r'\1-\2-\3-\4-\5\n'
+_UUID_PLAIN = r'\1\2\3\4\5\n'
+
+# Fonts shared by every instance of the tool
+_TITLE_FONT = QFont("Arial", 16, QFont.Weight.Bold)
+_LABEL_FONT = QFont("Arial", 10, QFont.Weight.Bold)
+_LARGE_MONO_FONT = QFont("Consolas", 11)
 
 
 class UuidGeneratorTool(QWidget):
@@ -18,7 +41,7 @@ class UuidGeneratorTool(QWidget):
 
     def __init__(self):
         super().__init__()
-        self.generated_uuids = []
+        self._last_count = 0  # Number of UUIDs in the output view
         self.setup_ui()
 
     def setup_ui(self):
@@ -29,7 +52,7 @@ class UuidGeneratorTool(QWidget):
 
         # Title
         title = QLabel("UUID Generator")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_TITLE_FONT)
         layout.addWidget(title)
 
         description = QLabel(
@@ -42,7 +65,7 @@ class UuidGeneratorTool(QWidget):
         # UUID Version selection
         version_layout = QHBoxLayout()
         version_label = QLabel("UUID Version:")
-        version_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        version_label.setFont(_LABEL_FONT)
         version_layout.addWidget(version_label)
 
         self.version_group = QButtonGroup()
@@ -62,7 +85,7 @@ class UuidGeneratorTool(QWidget):
         options_layout = QHBoxLayout()
 
         quantity_label = QLabel("Quantity:")
-        quantity_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        quantity_label.setFont(_LABEL_FONT)
         options_layout.addWidget(quantity_label)
 
         self.quantity_spin = QSpinBox()
@@ -103,13 +126,13 @@ class UuidGeneratorTool(QWidget):
 
         # Output section
         output_label = QLabel("Generated UUIDs:")
-        output_label.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+        output_label.setFont(_LABEL_FONT)
         layout.addWidget(output_label)
 
-        self.output_text = QTextEdit()
+        self.output_text = QPlainTextEdit()
         self.output_text.setReadOnly(True)
         self.output_text.setMinimumHeight(300)
-        self.output_text.setFont(QFont("Consolas", 11))
+        self.output_text.setFont(_LARGE_MONO_FONT)
         self.output_text.setPlaceholderText("Click 'Generate UUIDs' to create UUIDs...")
         layout.addWidget(self.output_text)
 
@@ -125,83 +148,50 @@ class UuidGeneratorTool(QWidget):
 
     def apply_button_styles(self):
         """Apply styles to buttons"""
-        button_style = """
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-size: 13px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton:pressed {
-                background-color: #005a9e;
-            }
-            QPushButton#copyButton {
-                background-color: #107c10;
-            }
-            QPushButton#copyButton:hover {
-                background-color: #0c5c0c;
-            }
-            QPushButton#clearButton {
-                background-color: #d13438;
-            }
-            QPushButton#clearButton:hover {
-                background-color: #a92a2d;
-            }
+        self.copy_btn.setObjectName("copyButton")
+        self.clear_btn.setObjectName("clearButton")
+        self.setStyleSheet(BUTTON_STYLE)
+
+    def generate_uuid_bytes(self, quantity, version):
         """
-        self.generate_btn.setStyleSheet(button_style)
-        self.copy_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#copyButton"))
-        self.clear_btn.setStyleSheet(button_style.replace("QPushButton", "QPushButton#clearButton"))
+        Generate quantity UUIDs of the given version (4 or 7) as one block of
+        16 bytes per UUID
 
-    def generate_uuid_v4(self):
-        """Generate UUID v4 (random)"""
-        return uuid.uuid4()
+        All random bits come from a single os.urandom call, and the version
+        and variant bits are set for every UUID at once through translation
+        tables rather than byte by byte in Python.
 
-    def generate_uuid_v7(self):
-        """
-        Generate UUID v7 (time-ordered)
-        UUID v7 is a draft standard for time-based UUIDs
-        Format: XXXXXXXX-XXXX-7XXX-YXXX-XXXXXXXXXXXX
-        where:
+        v7 UUIDs (XXXXXXXX-XXXX-7XXX-YXXX-XXXXXXXXXXXX) are time-ordered:
         - 48 bits: Unix timestamp in milliseconds
         - 4 bits: version (7)
-        - 12 bits: random (sub-millisecond precision + counter)
+        - 12 bits: random
         - 2 bits: variant
         - 62 bits: random
         """
-        # Get current time in milliseconds since Unix epoch
-        timestamp_ms = int(time.time() * 1000)
-
-        # 48-bit timestamp (will be valid until year 10889)
-        timestamp_bytes = timestamp_ms.to_bytes(6, byteorder='big')
-
-        # Random bytes for the rest
-        random_bytes = bytes([
-            # First 2 random bits + 4 bits version (7) + 12 random bits
-            (random_byte := uuid.uuid4().bytes[6]) & 0x0F | 0x70,
-            uuid.uuid4().bytes[7],
-            # Variant bits + random
-            uuid.uuid4().bytes[8] & 0x3F | 0x80,
-            uuid.uuid4().bytes[9],
-            uuid.uuid4().bytes[10],
-            uuid.uuid4().bytes[11],
-            uuid.uuid4().bytes[12],
-            uuid.uuid4().bytes[13],
-            uuid.uuid4().bytes[14],
-            uuid.uuid4().bytes[15]
-        ])
-
-        # Combine timestamp + version + variant + random
-        uuid_bytes = timestamp_bytes + random_bytes
-
-        # Format as UUID
-        return uuid.UUID(bytes=uuid_bytes)
-
+        data = bytearray(os.urandom(16 * quantity))
+
+        if version == 7:
+            # Get current time in milliseconds since Unix epoch as an exact
+            # integer; UUIDs generated together share it
+            timestamp_ms = time.time_ns() // 1_000_000
+
+            # 48-bit timestamp (will be valid until year 10889)
+            timestamp_bytes = timestamp_ms.to_bytes(6, byteorder='big')
+            for i, byte in enumerate(timestamp_bytes):
+                data[i::16] = bytes((byte,)) * quantity
+
+        # 4 bits version + 12 random bits
+        data[6::16] = data[6::16].translate(_VERSION_BITS[version])
+        # Variant bits + random
+        data[8::16] = data[8::16].translate(_VARIANT_BITS)
+
+        if version == 7 and quantity > 1:
+            # With the timestamp shared, sorting puts the batch in the
+            # ascending order v7 UUIDs are meant to be generated in
+            return b''.join(sorted(data[i:i + 16] for i in range(0, len(data), 16)))
+        return bytes(data)
+
+    @Slot()
     def generate_uuids(self):
         """Generate UUIDs based on selected options"""
         quantity = self.quantity_spin.value()
@@ -209,27 +199,19 @@ class UuidGeneratorTool(QWidget):
         uppercase = self.uppercase_cb.isChecked()
         without_dashes = self.without_dashes_cb.isChecked()
 
-        self.generated_uuids = []
+        self._last_count = 0
 
         try:
-            for _ in range(quantity):
-                if version == 4:
-                    generated_uuid = self.generate_uuid_v4()
-                else:
-                    generated_uuid = self.generate_uuid_v7()
-
-                uuid_str = str(generated_uuid)
-
-                if uppercase:
-                    uuid_str = uuid_str.upper()
-
-                if without_dashes:
-                    uuid_str = uuid_str.replace('-', '')
-
-                self.generated_uuids.append(uuid_str)
+            # Format all UUIDs from a single hex string in one substitution
+            hex_text = self.generate_uuid_bytes(quantity, version).hex()
+            if uppercase:
+                hex_text = hex_text.upper()
+            template = _UUID_PLAIN if without_dashes else _UUID_DASHED
+            uuid_text = _UUID_HEX.sub(template, hex_text)[:-1]
 
             # Display results
-            self.output_text.setPlainText('\n'.join(self.generated_uuids))
+            self.output_text.setPlainText(uuid_text)
+            self._last_count = quantity
 
             self.status_label.setText(
                 f"✅ Generated {quantity} UUID v{version}{'(s)' if quantity > 1 else ''}"
@@ -240,17 +222,17 @@ class UuidGeneratorTool(QWidget):
             self.status_label.setText(f"❌ Error: {str(e)}")
             self.status_label.setStyleSheet("color: #dc3545; padding: 5px;")
 
+    @Slot()
     def copy_all(self):
         """Copy all generated UUIDs to clipboard"""
-        if self.generated_uuids:
-            clipboard = self.output_text.textCursor()
-            self.output_text.selectAll()
-            self.output_text.copy()
-            self.status_label.setText(f"✅ Copied {len(self.generated_uuids)} UUID(s) to clipboard")
+        if self._last_count:
+            QGuiApplication.clipboard().setText(self.output_text.toPlainText())
+            self.status_label.setText(f"✅ Copied {self._last_count} UUID(s) to clipboard")
             self.status_label.setStyleSheet("color: #28a745; padding: 5px;")
 
+    @Slot()
     def clear_all(self):
         """Clear all fields"""
-        self.generated_uuids = []
+        self._last_count = 0
         self.output_text.clear()
         self.status_label.setText("")
@@ -2,21 +2,89 @@
 Main Window for QDevKit
 """
 
+import importlib
+
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QHBoxLayout, QListWidget, QStackedWidget,
-    QListWidgetItem, QLabel, QFrame
+    QApplication, QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QListView,
+    QStackedWidget, QLabel, QFrame
+)
+from PySide6.QtCore import (
+    Qt, QMargins, QModelIndex, QRunnable, QSignalBlocker, QSize,
+    QStringListModel, QThreadPool, QTimer, Slot
 )
-from PySide6.QtCore import Qt, QSize
-from PySide6.QtGui import QFont
 
-from tools.json_formatter import JsonFormatterTool
-from tools.json_path_filter import JsonPathFilterTool
-from tools.base64_tool import Base64Tool
-from tools.uuid_generator import UuidGeneratorTool
-from tools.jwt_decoder import JwtDecoderTool
-from tools.url_encoder import UrlEncoderTool
-from tools.timestamp_converter import TimestampConverter
-from tools.hash_generator import HashGeneratorTool
+# (name, module, class) of each tool, in sidebar order. Tool modules are
+# imported when the tool is first selected; keep QDevKit.spec's
+# hiddenimports in step, as PyInstaller cannot see these imports.
+TOOLS = [
+    ("JSON Formatter", "tools.json_formatter", "JsonFormatterTool"),
+    ("JSON Path Filter", "tools.json_path_filter", "JsonPathFilterTool"),
+    ("Base64 Encode/Decode", "tools.base64_tool", "Base64Tool"),
+    ("UUID Generator", "tools.uuid_generator", "UuidGeneratorTool"),
+    ("JWT Decoder", "tools.jwt_decoder", "JwtDecoderTool"),
+    ("URL Encoder/Decoder", "tools.url_encoder", "UrlEncoderTool"),
+    ("Timestamp Converter", "tools.timestamp_converter", "TimestampConverter"),
+    ("Hash Generator", "tools.hash_generator", "HashGeneratorTool"),
+]
+
+# Layout values shared by the window's layouts
+_ZERO_MARGINS = QMargins(0, 0, 0, 0)
+_SIDEBAR_WIDTH = 220
+
+# Sidebar and tool list styles, applied once to the whole application and
+# scoped by object name
+SIDEBAR_STYLE = """
+    QFrame#Sidebar {
+        background-color: #2b2b2b;
+        border-right: 1px solid #3d3d3d;
+    }
+    QLabel#SidebarHeader {
+        font: bold 11pt Arial;
+        color: #ffffff;
+        padding: 12px 15px;
+        border-bottom: 1px solid #3d3d3d;
+    }
+    QListView#ToolList {
+        background-color: #2b2b2b;
+        border: none;
+        color: #ffffff;
+        font-size: 13px;
+        outline: none;
+    }
+    QListView#ToolList::item {
+        padding: 12px 15px;
+        border-bottom: 1px solid #3d3d3d;
+    }
+    QListView#ToolList::item:selected {
+        background-color: #0078d4;
+        color: #ffffff;
+    }
+    QListView#ToolList::item:hover {
+        background-color: #3d3d3d;
+    }
+"""
+
+
+def create_tool(module_name, class_name):
+    """Import a tool's module and create the tool widget"""
+    return getattr(importlib.import_module(module_name), class_name)()
+
+
+class ToolPreloader(QRunnable):
+    """Imports the tool modules on the thread pool while the window starts up
+
+    A tool selected before its module is loaded simply waits on Python's
+    import lock, so the factories need no coordination with this task.
+    """
+
+    def run(self):
+        """Import each tool module in sidebar order"""
+        for _, module_name, _ in TOOLS:
+            try:
+                importlib.import_module(module_name)
+            except Exception:
+                # Reported again, from the GUI thread, when the tool is built
+                pass
 
 
 class MainWindow(QMainWindow):
@@ -27,16 +95,20 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("QDevKit - Developer Utilities")
         self.setMinimumSize(900, 600)
         self.resize(1000, 700)
+        QApplication.instance().setStyleSheet(SIDEBAR_STYLE)
 
         self.setup_ui()
 
+        # Warm up the remaining tools so selecting them later is quick
+        QThreadPool.globalInstance().start(ToolPreloader())
+
     def setup_ui(self):
         """Setup the main window UI"""
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
 
         main_layout = QHBoxLayout(central_widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.setContentsMargins(_ZERO_MARGINS)
         main_layout.setSpacing(0)
 
         # Create sidebar for tool selection
@@ -53,46 +125,30 @@ class MainWindow(QMainWindow):
     def create_sidebar(self):
         """Create the sidebar with tool list"""
         sidebar = QFrame()
+        sidebar.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        sidebar.setObjectName("Sidebar")
         sidebar.setFrameShape(QFrame.Shape.StyledPanel)
-        sidebar.setFixedWidth(220)
-        sidebar.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border-right: 1px solid #3d3d3d;
-            }
-        """)
-
-        layout = QHBoxLayout(sidebar)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        self.tool_list = QListWidget()
-        self.tool_list.setStyleSheet("""
-            QListWidget {
-                background-color: #2b2b2b;
-                border: none;
-                color: #ffffff;
-                font-size: 13px;
-                outline: none;
-            }
-            QListWidget::item {
-                padding: 12px 15px;
-                border-bottom: 1px solid #3d3d3d;
-            }
-            QListWidget::item:selected {
-                background-color: #0078d4;
-                color: #ffffff;
-            }
-            QListWidget::item:hover {
-                background-color: #3d3d3d;
-            }
-        """)
-
-        # Header
-        header = QListWidgetItem()
-        header.setText("  DEVELOPER TOOLS")
-        header.setFlags(Qt.ItemFlag.NoItemFlags)
-        header.setFont(QFont("Arial", 11, QFont.Weight.Bold))
-        self.tool_list.addItem(header)
+        sidebar.setFixedWidth(_SIDEBAR_WIDTH)
+
+        layout = QVBoxLayout(sidebar)
+        layout.setContentsMargins(_ZERO_MARGINS)
+        layout.setSpacing(0)
+
+        # Header, kept out of the list so its rows are exactly the tools
+        header = QLabel("  DEVELOPER TOOLS")
+        header.setObjectName("SidebarHeader")
+        layout.addWidget(header)
+
+        # A plain string model holds the tool names; rows follow TOOLS
+        self._tool_model = QStringListModel([tool_name for tool_name, _, _ in TOOLS])
+        self.tool_list = QListView()
+        self.tool_list.setObjectName("ToolList")
+        self.tool_list.setModel(self._tool_model)
+        self.tool_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        # Every row has the same font and padding, so one size serves them all
+        self.tool_list.setUniformItemSizes(True)
+        self.tool_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.tool_list.setBatchSize(16)
 
         layout.addWidget(self.tool_list)
 
@@ -100,34 +156,43 @@ class MainWindow(QMainWindow):
 
     def add_tools(self):
         """Add all tools to the window"""
-        tools = [
-            ("JSON Formatter", JsonFormatterTool),
-            ("JSON Path Filter", JsonPathFilterTool),
-            ("Base64 Encode/Decode", Base64Tool),
-            ("UUID Generator", UuidGeneratorTool),
-            ("JWT Decoder", JwtDecoderTool),
-            ("URL Encoder/Decoder", UrlEncoderTool),
-            ("Timestamp Converter", TimestampConverter),
-            ("Hash Generator", HashGeneratorTool),
-        ]
-
-        for tool_name, tool_class in tools:
-            # Add to list
-            item = QListWidgetItem()
-            item.setText(tool_name)
-            self.tool_list.addItem(item)
-
-            # Create tool widget and add to stack
-            tool_widget = tool_class()
-            self.tool_stack.addWidget(tool_widget)
-
-        # Connect selection change
-        self.tool_list.currentRowChanged.connect(self.on_tool_selected)
-
-        # Select first tool (skip header)
-        self.tool_list.setCurrentRow(1)
-
-    def on_tool_selected(self, index):
+        # Tools built so far, by class name; each tool is created and added
+        # to the stack the first time it is selected so startup only pays
+        # for one
+        self._tools = {}
+
+        # Select first tool without building it during construction; it is
+        # built once the event loop runs, after the window is shown
+        selection_model = self.tool_list.selectionModel()
+        with QSignalBlocker(selection_model):
+            self.tool_list.setCurrentIndex(self._tool_model.index(0))
+        QTimer.singleShot(0, self.show_current_tool)
+
+        # Connect selection change, queued so the new selection is painted
+        # before a tool that is built on first use
+        selection_model.currentRowChanged.connect(
+            self.on_tool_selected, Qt.ConnectionType.QueuedConnection
+        )
+
+    @Slot()
+    def show_current_tool(self):
+        """Show the tool selected in the sidebar"""
+        self.on_tool_selected(self.tool_list.currentIndex())
+
+    @Slot(QModelIndex)
+    def on_tool_selected(self, current):
         """Handle tool selection from sidebar"""
-        if index > 0:  # Skip header
-            self.tool_stack.setCurrentIndex(index - 1)
+        if not current.isValid():
+            return
+        _, module_name, class_name = TOOLS[current.row()]
+        tool = self._tools.get(class_name)
+        if tool is None:
+            tool = self._tools[class_name] = create_tool(module_name, class_name)
+            self.tool_stack.addWidget(tool)
+
+        # Hidden tools skip update bookkeeping until they are shown again
+        previous = self.tool_stack.currentWidget()
+        if previous is not None and previous is not tool:
+            previous.setUpdatesEnabled(False)
+        tool.setUpdatesEnabled(True)
+        self.tool_stack.setCurrentWidget(tool)